@@ -50,9 +50,25 @@ class Camera:
             (cfg.INTERNAL_HEIGHT, cfg.INTERNAL_WIDTH), dtype=np.uint8
         )
         self._body_detected = False
+        self._mask_version = 0      # Bumped every time a new mask is published
+        # Eroded collision hitbox, plus the same mask bit-packed along x
+        # (8 pixels per byte) for cheap occupancy tests.  Both are
+        # computed once per camera frame and replaced, never mutated.
+        self._collision_mask = np.zeros_like(self._body_mask)
+        self._collision_bits = np.packbits(self._collision_mask, axis=-1)
+        # Bounding box of the collision mask as (x0, y0, x1, y1), end
+        # exclusive; all zeros when the mask is empty
+        self._collision_bbox = (0, 0, 0, 0)
         self._raw_frame = None
         self._running = False
 
+        # RGB copy of the current frame for MediaPipe, converted into the
+        # same buffer every frame.  Segmentation runs synchronously and
+        # the buffer is never published, so reusing it is safe.
+        self._rgb_buf = np.empty(
+            (cfg.INTERNAL_HEIGHT, cfg.INTERNAL_WIDTH, 3), dtype=np.uint8
+        )
+
         # ── Initialize the correct MediaPipe backend ──
         if _USE_TASKS_API:
             self._init_tasks_api()
@@ -123,45 +139,71 @@ class Camera:
     def get_body_mask(self):
         """
         Return the latest body mask (binary uint8, same size as internal
-        resolution) and a boolean indicating whether a body was detected.
+        resolution), a boolean indicating whether a body was detected,
+        and the mask version.  The version only changes when the camera
+        thread publishes a new mask, so callers can skip work on frames
+        where it is unchanged.
         """
         with self._lock:
-            return self._body_mask.copy(), self._body_detected
+            return self._body_mask.copy(), self._body_detected, self._mask_version
 
     def get_collision_mask(self):
         """
-        Return an eroded version of the body mask for collision detection.
+        Return an eroded version of the body mask for collision detection,
+        the same mask bit-packed along each row (np.packbits), and its
+        bounding box (x0, y0, x1, y1).
         The erosion makes the hitbox slightly smaller than the visual
         silhouette, which feels more forgiving to the player.
+
+        All three are built by the capture thread once per camera frame,
+        so the game loop doesn't erode on every render frame.  Treat the
+        arrays as read-only.
         """
         with self._lock:
-            mask = self._body_mask.copy()
-        if cfg.COLLISION_ERODE_PX > 0:
-            mask = cv2.erode(mask, self._erode_kernel, iterations=1)
-        return mask
+            return self._collision_mask, self._collision_bits, self._collision_bbox
 
     def get_raw_frame(self):
         """Return the latest raw BGR camera frame (for debug overlay)."""
         with self._lock:
-            return self._raw_frame.copy() if self._raw_frame is not None else None
+            frame = self._raw_frame
+        if frame is None:
+            return None
+        # The capture loop stores frames unmirrored (see _capture_loop);
+        # flip returns a new array, so no extra copy is needed
+        return cv2.flip(frame, 1) if cfg.CAMERA_MIRROR else frame.copy()
 
     # ────────────────────────────────────────────────────────────
     # Capture loop (runs in daemon thread)
     # ────────────────────────────────────────────────────────────
 
-    def _capture_loop(self):
+    @staticmethod
+    def _open_capture():
         """
-        Continuously capture frames from the webcam, run MediaPipe,
-        and write results to the shared buffer.
+        Open the webcam with the capture settings from config.  MJPG makes
+        most USB webcams send compressed frames (decoded by OpenCV's
+        libjpeg-turbo) instead of raw YUY2, which is far less USB
+        bandwidth and often the only way to get full frame rate.
         """
         cap = cv2.VideoCapture(cfg.CAMERA_INDEX)
+        # FOURCC first: some backends only honour it before the size
+        if cfg.CAMERA_FOURCC:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*cfg.CAMERA_FOURCC))
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, cfg.INTERNAL_WIDTH)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, cfg.INTERNAL_HEIGHT)
+        cap.set(cv2.CAP_PROP_FPS, cfg.CAMERA_FPS)
         cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
         if cfg.LOCK_EXPOSURE:
             cap.set(cv2.CAP_PROP_AUTO_EXPOSURE, 0.25)
             cap.set(cv2.CAP_PROP_EXPOSURE, cfg.EXPOSURE_VALUE)
+        return cap
+
+    def _capture_loop(self):
+        """
+        Continuously capture frames from the webcam, run MediaPipe,
+        and write results to the shared buffer.
+        """
+        cap = self._open_capture()
 
         while self._running:
             ret, frame = cap.read()
@@ -169,20 +211,15 @@ class Camera:
                 # Camera disconnected — wait and retry
                 time.sleep(0.5)
                 cap.release()
-                cap = cv2.VideoCapture(cfg.CAMERA_INDEX)
-                cap.set(cv2.CAP_PROP_FRAME_WIDTH, cfg.INTERNAL_WIDTH)
-                cap.set(cv2.CAP_PROP_FRAME_HEIGHT, cfg.INTERNAL_HEIGHT)
+                cap = self._open_capture()
                 continue
 
-            if cfg.CAMERA_MIRROR:
-                frame = cv2.flip(frame, 1)
-
             h, w = frame.shape[:2]
             if w != cfg.INTERNAL_WIDTH or h != cfg.INTERNAL_HEIGHT:
                 frame = cv2.resize(frame, (cfg.INTERNAL_WIDTH, cfg.INTERNAL_HEIGHT))
 
             # ── Run segmentation ──
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
 
             if _USE_TASKS_API:
                 binary_mask = self._process_tasks_api(frame_rgb)
@@ -194,6 +231,11 @@ class Camera:
                 binary_mask = np.zeros(
                     (cfg.INTERNAL_HEIGHT, cfg.INTERNAL_WIDTH), dtype=np.uint8
                 )
+            elif cfg.CAMERA_MIRROR:
+                # Mirror the single-channel mask rather than the 3-channel
+                # frame before segmentation: same result, a third of the
+                # bytes copied
+                binary_mask = cv2.flip(binary_mask, 1)
 
             # ── Clean noisy edges with morphology ──
             if cfg.ENABLE_MASK_CLEANING:
@@ -206,10 +248,24 @@ class Camera:
 
             body_detected = np.count_nonzero(binary_mask) > cfg.BODY_DETECT_MIN_PIXELS
 
+            # ── Collision hitbox (eroded + bit-packed) ──
+            collision_mask = binary_mask
+            if cfg.COLLISION_ERODE_PX > 0:
+                collision_mask = cv2.erode(
+                    binary_mask, self._erode_kernel, iterations=1
+                )
+            collision_bits = np.packbits(collision_mask, axis=-1)
+            bx, by, bw, bh = cv2.boundingRect(collision_mask)
+            collision_bbox = (bx, by, bx + bw, by + bh)
+
             # ── Write to shared buffer ──
             with self._lock:
                 self._body_mask = binary_mask
                 self._body_detected = body_detected
+                self._mask_version += 1
+                self._collision_mask = collision_mask
+                self._collision_bits = collision_bits
+                self._collision_bbox = collision_bbox
                 self._raw_frame = frame
 
         # Cleanup
@@ -274,9 +330,13 @@ class Camera:
         Returns a binary uint8 mask (0 or 255).
         """
         try:
-            frame_rgb.flags.writeable = False
-            seg_result = self._segmenter.process(frame_rgb)
-            frame_rgb.flags.writeable = True
+            # Pass a read-only view (lets MediaPipe skip its copy).  The
+            # flag is never set on the shared capture buffer itself, so a
+            # failing process() cannot leave it read-only for the next
+            # cvtColor(dst=...)
+            frame_view = frame_rgb.view()
+            frame_view.flags.writeable = False
+            seg_result = self._segmenter.process(frame_view)
 
             raw_mask = seg_result.segmentation_mask  # float32 [0,1]
             binary = (raw_mask > cfg.SEGMENTATION_THRESHOLD).astype(np.uint8) * 255
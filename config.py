@@ -15,11 +15,17 @@ INTERNAL_HEIGHT = 480
 DISPLAY_WIDTH = 1920
 DISPLAY_HEIGHT = 1080
 FULLSCREEN = True      # Set False for development/debugging
+# Let SDL's renderer upscale internal→display on the GPU (pygame.SCALED).
+# Keeps the 4:3 aspect ratio (letterboxed on 16:9). Set False to fall
+# back to a CPU smoothscale stretched to the full display.
+GPU_SCALING = True
 TARGET_FPS = 30
 
 # ─── Camera ────────────────────────────────────────────────────────
 CAMERA_INDEX = 0                  # 0 = default webcam
 CAMERA_MIRROR = True              # Flip horizontally for mirror effect
+CAMERA_FOURCC = "MJPG"            # Compressed USB stream; None = driver default
+CAMERA_FPS = 30                   # Requested capture rate
 LOCK_EXPOSURE = False             # Set True at venue after manual tuning
 EXPOSURE_VALUE = -6               # Manual exposure (camera-dependent)
 # MediaPipe Selfie Segmentation
@@ -113,6 +119,7 @@ BODY_DILATE_KERNEL = 3         # Kernel size for edge thickening
 BODY_DILATE_ITERATIONS = 1
 BODY_GLOW_KERNEL = 21          # Gaussian blur for neon glow halo
 BODY_GLOW_INTENSITY = 0.6      # Blend weight of glow layer
+BODY_RENDER_SCALE = 0.5        # Neon pipeline resolution (1.0 = internal)
 
 # Collision forgiveness: erode body mask before collision check
 # Makes the hitbox slightly smaller than the visual silhouette.
@@ -150,7 +157,7 @@ IDLE_TEXT_SUB = "to play"
 IDLE_PULSE_SPEED = 2.0         # Speed of text pulsing animation
 
 # ─── Leaderboard ──────────────────────────────────────────────────
-LEADERBOARD_FILE = "leaderboard.json"
+LEADERBOARD_FILE = "leaderboard.bin"   # An old leaderboard.json is migrated
 LEADERBOARD_MAX_ENTRIES = 10
 
 # ─── Body Detection Thresholds ────────────────────────────────────
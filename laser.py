@@ -17,8 +17,8 @@ Difficulty parameters are computed from the survival time T using
 the formulas in config.py.
 """
 
-import random
 import math
+import random
 import numpy as np
 import pygame
 
@@ -68,6 +68,68 @@ def get_available_types(T):
 # Safe zone indicator color
 COLOR_SAFE_ZONE = (0, 255, 100)
 
+# Core opacity (0-255) of standard and anti-camp beams at full intensity
+BEAM_CORE_ALPHA = 220
+ANTI_CAMP_CORE_ALPHA = 240
+# Head hunter zone body and bright bottom-edge stripe opacity (0-255)
+HEAD_HUNTER_ZONE_ALPHA = 160
+HEAD_HUNTER_EDGE_ALPHA = 220
+
+# Glow settings bound once at import so beam setup and rendering don't
+# go through the config module on every call
+_BEAM_OUTER_GLOW = cfg.BEAM_OUTER_GLOW
+_BEAM_INNER_GLOW = cfg.BEAM_INNER_GLOW
+_BEAM_OUTER_ALPHA = cfg.BEAM_OUTER_ALPHA
+_BEAM_INNER_ALPHA = cfg.BEAM_INNER_ALPHA
+
+# Steps used to quantize beam pulse/fade intensity.  LaserManager only
+# re-renders its cached layer when some beam changes level.
+RENDER_LEVELS = 32
+
+# Number of uniform draws pre-generated per refill of the spawn RNG pool
+RNG_POOL_SIZE = 1024
+
+
+def _glow_layers(color, core_alpha):
+    """
+    Additive (outer, inner, core) RGB fills for a beam at full intensity.
+
+    Active beams are drawn straight onto the game surface with
+    BLEND_RGB_ADD.  The layers are nested rects, so each one adds only
+    the difference over the layer beneath it; on the near-black
+    background the sum matches alpha-blending color at each layer's
+    opacity.
+    """
+    core_a = core_alpha / 255.0
+    return (
+        _premultiply(color, _BEAM_OUTER_ALPHA),
+        _premultiply(color, max(0.0, _BEAM_INNER_ALPHA - _BEAM_OUTER_ALPHA)),
+        _premultiply(color, max(0.0, core_a - _BEAM_INNER_ALPHA)),
+    )
+
+
+def _head_hunter_layers(color):
+    """Additive (zone, edge stripe, glow) RGB fills for the head hunter."""
+    zone_a = HEAD_HUNTER_ZONE_ALPHA / 255.0
+    edge_a = HEAD_HUNTER_EDGE_ALPHA / 255.0
+    return (
+        _premultiply(color, zone_a),
+        _premultiply(color, max(0.0, edge_a - zone_a)),
+        _premultiply(color, _BEAM_OUTER_ALPHA),
+    )
+
+
+def _premultiply(color, alpha):
+    """Scale an RGB color by an opacity in [0, 1]."""
+    return tuple(int(c * alpha) for c in color)
+
+
+def _fade_layers(layers, alpha_mult):
+    """Dim each additive layer (flash-in / fade-out frames)."""
+    if alpha_mult >= 1.0:
+        return layers
+    return tuple(_premultiply(layer, alpha_mult) for layer in layers)
+
 
 # ────────────────────────────────────────────────────────────
 # Laser beam class
@@ -87,13 +149,23 @@ class Laser:
     PHASE_WARNING = "warning"
     PHASE_ACTIVE = "active"
 
-    def __init__(self, beam_type, T, screen_w, screen_h, target_x=None):
+    def __init__(self, beam_type, T, screen_w, screen_h, target_x=None,
+                 randint=None):
         self.beam_type = beam_type
+        # Integer source for positions/gaps, inclusive on both ends.
+        # LaserManager passes its pooled generator; standalone use falls
+        # back to the stdlib.
+        self._randint = randint or random.randint
         self.screen_w = screen_w
         self.screen_h = screen_h
         self.alive = True
         self.beam_width = cfg.BEAM_CORE_WIDTH
 
+        # Half-widths used by every collision and render call
+        self._bw = self.beam_width // 2
+        self._outer_bw = self._bw + _BEAM_OUTER_GLOW
+        self._inner_bw = self._bw + _BEAM_INNER_GLOW
+
         # Default timing (setup methods may override)
         self.warning_duration = get_warning_ms(T) / 1000.0
         self.active_duration = get_active_duration(T)
@@ -111,6 +183,24 @@ class Laser:
         elif beam_type == "anti_camp":
             self._setup_anti_camp(target_x)
 
+        # Colors never change after setup — build the glow fill colors
+        # once instead of rebuilding color tuples on every draw call.
+        if beam_type == "cross":
+            self._primary_color = self.color_h
+            self._layers_h = _glow_layers(self.color_h, BEAM_CORE_ALPHA)
+            self._layers_v = _glow_layers(self.color_v, BEAM_CORE_ALPHA)
+        elif beam_type == "anti_camp":
+            self._primary_color = self.color
+            self._layers = _glow_layers(self.color, ANTI_CAMP_CORE_ALPHA)
+        elif beam_type == "head_hunter":
+            self._primary_color = self.color
+            self._layers = _head_hunter_layers(self.color)
+        else:
+            self._primary_color = self.color
+            self._layers = _glow_layers(self.color, BEAM_CORE_ALPHA)
+
+        self._collision_rects = self._build_collision_rects()
+
         # Initialize phase AFTER setup (so overrides take effect)
         self.phase = self.PHASE_WARNING
         self.phase_timer = self.warning_duration
@@ -121,19 +211,22 @@ class Laser:
         """Full-width beam at a fixed Y, gap along X axis."""
         self.color = cfg.COLOR_LASER_HORIZONTAL
         margin = 60
-        self.y_pos = random.randint(margin, self.screen_h - margin)
+        self.y_pos = self._randint(margin, self.screen_h - margin)
         gap_w = int(self.screen_w * gap_frac)
         gap_margin = gap_w // 2 + 20
-        self.gap_center_x = random.randint(gap_margin, self.screen_w - gap_margin)
+        self.gap_center_x = self._randint(gap_margin, self.screen_w - gap_margin)
         self.gap_size = gap_w
+        self._gap_l = self.gap_center_x - gap_w // 2
+        self._gap_r = self.gap_center_x + gap_w // 2
 
     def _setup_vertical(self):
         """Full-height solid beam at a fixed X — no gap, must dodge entirely."""
         self.color = cfg.COLOR_LASER_VERTICAL
         margin = 60
-        self.x_pos = random.randint(margin, self.screen_w - margin)
+        self.x_pos = self._randint(margin, self.screen_w - margin)
         self.gap_center_y = self.screen_h // 2  # unused, kept for compatibility
         self.gap_size = 0  # no gap — solid beam
+        self._gap_t = self._gap_b = self.gap_center_y
 
     def _setup_cross(self, gap_frac):
         """Simultaneous horizontal + vertical beams."""
@@ -142,18 +235,22 @@ class Laser:
 
         h_margin = 60
         v_margin = 60
-        self.y_pos = random.randint(h_margin, self.screen_h - h_margin)
-        self.x_pos = random.randint(v_margin, self.screen_w - v_margin)
+        self.y_pos = self._randint(h_margin, self.screen_h - h_margin)
+        self.x_pos = self._randint(v_margin, self.screen_w - v_margin)
 
         gap_w = int(self.screen_w * gap_frac)
         gap_h = int(self.screen_h * gap_frac)
         gap_margin_w = gap_w // 2 + 20
         gap_margin_h = gap_h // 2 + 20
 
-        self.h_gap_center_x = random.randint(gap_margin_w, self.screen_w - gap_margin_w)
+        self.h_gap_center_x = self._randint(gap_margin_w, self.screen_w - gap_margin_w)
         self.h_gap_size = gap_w
-        self.v_gap_center_y = random.randint(gap_margin_h, self.screen_h - gap_margin_h)
+        self.v_gap_center_y = self._randint(gap_margin_h, self.screen_h - gap_margin_h)
         self.v_gap_size = gap_h
+        self._h_gap_l = self.h_gap_center_x - gap_w // 2
+        self._h_gap_r = self.h_gap_center_x + gap_w // 2
+        self._v_gap_t = self.v_gap_center_y - gap_h // 2
+        self._v_gap_b = self.v_gap_center_y + gap_h // 2
 
     def _setup_head_hunter(self):
         """Solid zone covering top 40% of screen — no gap, must duck."""
@@ -190,103 +287,179 @@ class Laser:
         return self.alive
 
     # ────────────────────────────────────────────────────────────
-    # Collision mask
+    # Collision geometry
     # ────────────────────────────────────────────────────────────
 
-    def get_collision_mask(self):
-        """Return collision mask (only during ACTIVE phase)."""
-        if self.phase != self.PHASE_ACTIVE:
-            return None
-
-        mask = np.zeros((self.screen_h, self.screen_w), dtype=np.uint8)
-
+    def _build_collision_rects(self):
+        """
+        Describe the dangerous area as a list of (y0, y1, x0, x1) slices.
+        Beams never move once spawned, so this is computed once.
+        """
+        rects = []
         if self.beam_type == "horizontal":
-            self._fill_h_mask(mask, self.y_pos, self.gap_center_x, self.gap_size)
+            self._add_h_rects(rects, self.y_pos, self._gap_l, self._gap_r)
         elif self.beam_type == "vertical":
-            self._fill_v_mask(mask, self.x_pos, self.gap_center_y, self.gap_size)
+            self._add_v_rects(rects, self.x_pos, self._gap_t, self._gap_b)
         elif self.beam_type == "cross":
-            self._fill_h_mask(mask, self.y_pos, self.h_gap_center_x, self.h_gap_size)
-            self._fill_v_mask(mask, self.x_pos, self.v_gap_center_y, self.v_gap_size)
+            h_rects = []
+            v_rects = []
+            self._add_h_rects(h_rects, self.y_pos, self._h_gap_l, self._h_gap_r)
+            self._add_v_rects(v_rects, self.x_pos, self._v_gap_t, self._v_gap_b)
+            # The vertical gap stays safe where it crosses the horizontal
+            # band, so it is cut out of the horizontal slices too
+            x_l = max(0, self.x_pos - self._bw)
+            x_r = min(self.screen_w, self.x_pos + self._bw)
+            if x_l < x_r:
+                gap = (max(0, self._v_gap_t), min(self.screen_h, self._v_gap_b),
+                       x_l, x_r)
+                h_rects = [piece for rect in h_rects
+                           for piece in self._subtract_rect(rect, gap)]
+            # Where the beams overlap, cut the crossing out of the vertical
+            # slices so the slices stay disjoint and no body pixel is
+            # counted twice in the hit centroid
+            for cut in h_rects:
+                v_rects = [piece for rect in v_rects
+                           for piece in self._subtract_rect(rect, cut)]
+            rects.extend(h_rects)
+            rects.extend(v_rects)
         elif self.beam_type == "head_hunter":
-            mask[:self._zone_y_bot, :] = 255
+            if self._zone_y_bot > 0:
+                rects.append((0, self._zone_y_bot, 0, self.screen_w))
         elif self.beam_type == "anti_camp":
-            bw = self.beam_width // 2
-            x_l = max(0, self.x_pos - bw)
-            x_r = min(self.screen_w, self.x_pos + bw)
-            mask[:, x_l:x_r] = 255
-
-        return mask
-
-    def _fill_h_mask(self, mask, y, gap_cx, gap_size):
-        """Fill horizontal beam collision area (full width with gap)."""
-        bw = self.beam_width // 2
-        y_top = max(0, y - bw)
-        y_bot = min(self.screen_h, y + bw)
+            x_l = max(0, self.x_pos - self._bw)
+            x_r = min(self.screen_w, self.x_pos + self._bw)
+            if x_l < x_r:
+                rects.append((0, self.screen_h, x_l, x_r))
+        return rects
+
+    def _add_h_rects(self, rects, y, gap_l, gap_r):
+        """Horizontal beam band (full width) split around its gap."""
+        y_top = max(0, y - self._bw)
+        y_bot = min(self.screen_h, y + self._bw)
         if y_top >= y_bot:
             return
-        mask[y_top:y_bot, :] = 255
-        gap_l = max(0, gap_cx - gap_size // 2)
-        gap_r = min(self.screen_w, gap_cx + gap_size // 2)
-        mask[y_top:y_bot, gap_l:gap_r] = 0
-
-    def _fill_v_mask(self, mask, x, gap_cy, gap_size):
-        """Fill vertical beam collision area (full height with gap)."""
-        bw = self.beam_width // 2
-        x_l = max(0, x - bw)
-        x_r = min(self.screen_w, x + bw)
+        gap_l = max(0, gap_l)
+        gap_r = min(self.screen_w, gap_r)
+        if gap_l >= gap_r:
+            rects.append((y_top, y_bot, 0, self.screen_w))
+            return
+        if gap_l > 0:
+            rects.append((y_top, y_bot, 0, gap_l))
+        if gap_r < self.screen_w:
+            rects.append((y_top, y_bot, gap_r, self.screen_w))
+
+    def _add_v_rects(self, rects, x, gap_t, gap_b):
+        """Vertical beam band (full height) split around its gap."""
+        x_l = max(0, x - self._bw)
+        x_r = min(self.screen_w, x + self._bw)
         if x_l >= x_r:
             return
-        mask[:, x_l:x_r] = 255
-        gap_t = max(0, gap_cy - gap_size // 2)
-        gap_b = min(self.screen_h, gap_cy + gap_size // 2)
-        mask[gap_t:gap_b, x_l:x_r] = 0
+        gap_t = max(0, gap_t)
+        gap_b = min(self.screen_h, gap_b)
+        if gap_t >= gap_b:
+            rects.append((0, self.screen_h, x_l, x_r))
+            return
+        if gap_t > 0:
+            rects.append((0, gap_t, x_l, x_r))
+        if gap_b < self.screen_h:
+            rects.append((gap_b, self.screen_h, x_l, x_r))
+
+    @staticmethod
+    def _subtract_rect(rect, cut):
+        """Split a (y0, y1, x0, x1) slice into the pieces not covered by cut."""
+        y0, y1, x0, x1 = rect
+        cy0, cy1, cx0, cx1 = cut
+        if cy0 >= y1 or cy1 <= y0 or cx0 >= x1 or cx1 <= x0:
+            return [rect]
+        pieces = []
+        if y0 < cy0:
+            pieces.append((y0, cy0, x0, x1))
+        if cy1 < y1:
+            pieces.append((cy1, y1, x0, x1))
+        my0, my1 = max(y0, cy0), min(y1, cy1)
+        if x0 < cx0:
+            pieces.append((my0, my1, x0, cx0))
+        if cx1 < x1:
+            pieces.append((my0, my1, cx1, x1))
+        return pieces
+
+    def get_collision_rects(self):
+        """Return the dangerous (y0, y1, x0, x1) slices, or [] outside ACTIVE."""
+        if self.phase != self.PHASE_ACTIVE:
+            return []
+        return self._collision_rects
+
+    def get_collision_mask(self):
+        """Return collision mask (only during ACTIVE phase)."""
+        if self.phase != self.PHASE_ACTIVE:
+            return None
+
+        mask = np.zeros((self.screen_h, self.screen_w), dtype=np.uint8)
+        for y0, y1, x0, x1 in self._collision_rects:
+            mask[y0:y1, x0:x1] = 255
+        return mask
 
     # ────────────────────────────────────────────────────────────
     # Rendering
     # ────────────────────────────────────────────────────────────
 
-    def render(self, surface):
+    def render_level(self):
+        """
+        Current beam intensity quantized to RENDER_LEVELS steps: the
+        warning pulse, or the flash-in / fade-out multiplier once active.
+        Two frames with the same level draw identical pixels.
+        """
+        if self.phase == self.PHASE_WARNING:
+            progress = 1.0 - (self.phase_timer / self.warning_duration)  # 0→1
+            intensity = abs(math.sin(progress * math.pi * 6)) * 0.5 + 0.3
+        else:
+            # Flash-in effect during first 0.15 seconds
+            time_active = self.active_duration - self.phase_timer
+            flash_mult = min(1.0, time_active / 0.15)
+
+            # Fade-out during last 0.3 seconds (visual hint that beam is ending)
+            fade_mult = min(1.0, self.phase_timer / 0.3)
+
+            intensity = max(0.0, flash_mult * fade_mult)
+        return round(intensity * RENDER_LEVELS)
+
+    def render(self, surface, level=None):
         """Draw the beam onto the game surface."""
+        if level is None:
+            level = self.render_level()
         if self.phase == self.PHASE_WARNING:
-            self._render_warning(surface)
+            self._render_warning(surface, level / RENDER_LEVELS)
         elif self.phase == self.PHASE_ACTIVE:
-            self._render_active(surface)
+            self._render_active(surface, level / RENDER_LEVELS)
 
     def _get_primary_color(self):
         """Get the main color (for particles on collision)."""
-        if self.beam_type == "cross":
-            return self.color_h
-        return self.color
+        return self._primary_color
 
     # ── Warning rendering ──
 
-    def _render_warning(self, surface):
+    def _render_warning(self, surface, pulse):
         """Show beam preview with highlighted safe gap / action hint."""
-        progress = 1.0 - (self.phase_timer / self.warning_duration)  # 0→1
-        pulse = abs(math.sin(progress * math.pi * 6)) * 0.5 + 0.3
-
         if self.beam_type == "horizontal":
-            self._render_warning_h(surface, pulse, self.y_pos,
-                                   self.gap_center_x, self.gap_size, self.color)
+            self._render_warning_h(surface, pulse, self.y_pos, self._gap_l,
+                                   self._gap_r, self.gap_size, self.color)
         elif self.beam_type == "vertical":
-            self._render_warning_v(surface, pulse, self.x_pos,
-                                   self.gap_center_y, self.gap_size, self.color)
+            self._render_warning_v(surface, pulse, self.x_pos, self._gap_t,
+                                   self._gap_b, self.gap_size, self.color)
         elif self.beam_type == "cross":
-            self._render_warning_h(surface, pulse, self.y_pos,
-                                   self.h_gap_center_x, self.h_gap_size, self.color_h)
-            self._render_warning_v(surface, pulse, self.x_pos,
-                                   self.v_gap_center_y, self.v_gap_size, self.color_v)
+            self._render_warning_h(surface, pulse, self.y_pos, self._h_gap_l,
+                                   self._h_gap_r, self.h_gap_size, self.color_h)
+            self._render_warning_v(surface, pulse, self.x_pos, self._v_gap_t,
+                                   self._v_gap_b, self.v_gap_size, self.color_v)
         elif self.beam_type == "head_hunter":
             self._render_warning_head(surface, pulse)
         elif self.beam_type == "anti_camp":
             self._render_warning_anticamp(surface, pulse)
 
-    def _render_warning_h(self, surface, pulse, y, gap_cx, gap_size, color):
+    def _render_warning_h(self, surface, pulse, y, gap_l, gap_r, gap_size, color):
         """Warning indicator for horizontal beam: faint line + green gap."""
         w = surface.get_width()
-        bw = self.beam_width // 2
-        gap_l = gap_cx - gap_size // 2
-        gap_r = gap_cx + gap_size // 2
+        bw = self._bw
 
         warn_surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
 
@@ -327,12 +500,10 @@ class Laser:
 
         surface.blit(warn_surf, (0, 0))
 
-    def _render_warning_v(self, surface, pulse, x, gap_cy, gap_size, color):
+    def _render_warning_v(self, surface, pulse, x, gap_t, gap_b, gap_size, color):
         """Warning indicator for vertical beam: faint line + green gap."""
         h = surface.get_height()
-        bw = self.beam_width // 2
-        gap_t = gap_cy - gap_size // 2
-        gap_b = gap_cy + gap_size // 2
+        bw = self._bw
 
         warn_surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
 
@@ -407,7 +578,7 @@ class Laser:
         """Warning for anti-camp beam: pulsing red vertical line."""
         h = surface.get_height()
         x = self.x_pos
-        bw = self.beam_width // 2
+        bw = self._bw
 
         warn_surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
         beam_alpha = int(pulse * 100)
@@ -417,28 +588,19 @@ class Laser:
 
     # ── Active rendering ──
 
-    def _render_active(self, surface):
+    def _render_active(self, surface, alpha_mult):
         """Render the full beam with glow at its fixed position."""
-        # Flash-in effect during first 0.15 seconds
-        time_active = self.active_duration - self.phase_timer
-        flash_mult = min(1.0, time_active / 0.15)
-
-        # Fade-out during last 0.3 seconds (visual hint that beam is ending)
-        fade_mult = min(1.0, self.phase_timer / 0.3)
-
-        alpha_mult = flash_mult * fade_mult
-
         if self.beam_type == "horizontal":
-            self._render_h_beam(surface, self.y_pos, self.gap_center_x,
-                                self.gap_size, self.color, alpha_mult)
+            self._render_h_beam(surface, self.y_pos, self._gap_l,
+                                self._gap_r, self._layers, alpha_mult)
         elif self.beam_type == "vertical":
-            self._render_v_beam(surface, self.x_pos, self.gap_center_y,
-                                self.gap_size, self.color, alpha_mult)
+            self._render_v_beam(surface, self.x_pos, self._gap_t,
+                                self._gap_b, self._layers, alpha_mult)
         elif self.beam_type == "cross":
-            self._render_h_beam(surface, self.y_pos, self.h_gap_center_x,
-                                self.h_gap_size, self.color_h, alpha_mult)
-            self._render_v_beam(surface, self.x_pos, self.v_gap_center_y,
-                                self.v_gap_size, self.color_v, alpha_mult)
+            self._render_h_beam(surface, self.y_pos, self._h_gap_l,
+                                self._h_gap_r, self._layers_h, alpha_mult)
+            self._render_v_beam(surface, self.x_pos, self._v_gap_t,
+                                self._v_gap_b, self._layers_v, alpha_mult)
         elif self.beam_type == "head_hunter":
             self._render_active_head(surface, alpha_mult)
         elif self.beam_type == "anti_camp":
@@ -449,142 +611,110 @@ class Laser:
         """Render head hunter: solid purple zone with glow at bottom edge."""
         w = surface.get_width()
         y_bot = self._zone_y_bot
-
-        glow_surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        add = pygame.BLEND_RGB_ADD
+        zone_color, edge_color, glow_color = _fade_layers(self._layers, alpha_mult)
 
         # Main purple zone
-        core_alpha = int(160 * alpha_mult)
-        pygame.draw.rect(glow_surf, (*self.color, core_alpha),
-                         (0, 0, w, y_bot))
+        surface.fill(zone_color, (0, 0, w, y_bot), special_flags=add)
 
-        # Brighter stripe at the bottom edge (the dangerous boundary)
+        # Brighter stripe at the bottom edge (the dangerous boundary),
+        # added on top of the zone fill
         edge_h = 6
-        bright_alpha = int(220 * alpha_mult)
-        pygame.draw.rect(glow_surf, (*self.color, bright_alpha),
-                         (0, y_bot - edge_h, w, edge_h))
+        surface.fill(edge_color, (0, y_bot - edge_h, w, edge_h), special_flags=add)
 
         # Glow below the bottom edge
         glow_h = 25
-        glow_alpha = int(cfg.BEAM_OUTER_ALPHA * 255 * alpha_mult)
-        pygame.draw.rect(glow_surf, (*self.color, glow_alpha),
-                         (0, y_bot, w, glow_h))
-
-        surface.blit(glow_surf, (0, 0))
+        surface.fill(glow_color, (0, y_bot, w, glow_h), special_flags=add)
 
     def _render_active_anticamp(self, surface, alpha_mult):
         """Render anti-camp beam: intense red vertical beam, no gap."""
         h = surface.get_height()
         x = self.x_pos
-        bw = self.beam_width // 2
+        bw = self._bw
+        outer_bw = self._outer_bw
+        inner_bw = self._inner_bw
+        add = pygame.BLEND_RGB_ADD
 
-        glow_surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        outer_color, inner_color, core_color = _fade_layers(self._layers, alpha_mult)
 
         # Outer glow
-        outer_bw = bw + cfg.BEAM_OUTER_GLOW
-        outer_alpha = int(cfg.BEAM_OUTER_ALPHA * 255 * alpha_mult)
-        pygame.draw.rect(glow_surf, (*self.color, outer_alpha),
-                         (x - outer_bw, 0, outer_bw * 2, h))
+        surface.fill(outer_color, (x - outer_bw, 0, outer_bw * 2, h),
+                     special_flags=add)
 
         # Inner glow
-        inner_bw = bw + cfg.BEAM_INNER_GLOW
-        inner_alpha = int(cfg.BEAM_INNER_ALPHA * 255 * alpha_mult)
-        pygame.draw.rect(glow_surf, (*self.color, inner_alpha),
-                         (x - inner_bw, 0, inner_bw * 2, h))
+        surface.fill(inner_color, (x - inner_bw, 0, inner_bw * 2, h),
+                     special_flags=add)
 
         # Core
-        core_alpha = int(240 * alpha_mult)
-        pygame.draw.rect(glow_surf, (*self.color, core_alpha),
-                         (x - bw, 0, bw * 2, h))
-
-        surface.blit(glow_surf, (0, 0))
+        surface.fill(core_color, (x - bw, 0, bw * 2, h), special_flags=add)
 
     # ── Standard beam rendering (horizontal / vertical with gap) ──
 
-    def _render_h_beam(self, surface, y, gap_cx, gap_size, color, alpha_mult=1.0):
+    def _render_h_beam(self, surface, y, gap_l, gap_r, layers, alpha_mult=1.0):
         """Render a horizontal beam with glow layers and gap."""
         w = surface.get_width()
-        bw = self.beam_width // 2
-        gap_l = gap_cx - gap_size // 2
-        gap_r = gap_cx + gap_size // 2
-
-        glow_surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        bw = self._bw
+        outer_bw = self._outer_bw
+        inner_bw = self._inner_bw
+        add = pygame.BLEND_RGB_ADD
+        outer_color, inner_color, core_color = _fade_layers(layers, alpha_mult)
 
         # Outer glow
-        outer_bw = bw + cfg.BEAM_OUTER_GLOW
-        outer_alpha = int(cfg.BEAM_OUTER_ALPHA * 255 * alpha_mult)
-        outer_color = (*color, outer_alpha)
         if gap_l > 0:
-            pygame.draw.rect(glow_surf, outer_color,
-                             (0, y - outer_bw, gap_l, outer_bw * 2))
+            surface.fill(outer_color, (0, y - outer_bw, gap_l, outer_bw * 2),
+                         special_flags=add)
         if gap_r < w:
-            pygame.draw.rect(glow_surf, outer_color,
-                             (gap_r, y - outer_bw, w - gap_r, outer_bw * 2))
+            surface.fill(outer_color, (gap_r, y - outer_bw, w - gap_r, outer_bw * 2),
+                         special_flags=add)
 
         # Inner glow
-        inner_bw = bw + cfg.BEAM_INNER_GLOW
-        inner_alpha = int(cfg.BEAM_INNER_ALPHA * 255 * alpha_mult)
-        inner_color = (*color, inner_alpha)
         if gap_l > 0:
-            pygame.draw.rect(glow_surf, inner_color,
-                             (0, y - inner_bw, gap_l, inner_bw * 2))
+            surface.fill(inner_color, (0, y - inner_bw, gap_l, inner_bw * 2),
+                         special_flags=add)
         if gap_r < w:
-            pygame.draw.rect(glow_surf, inner_color,
-                             (gap_r, y - inner_bw, w - gap_r, inner_bw * 2))
+            surface.fill(inner_color, (gap_r, y - inner_bw, w - gap_r, inner_bw * 2),
+                         special_flags=add)
 
         # Core beam
-        core_alpha = int(220 * alpha_mult)
-        core_color = (*color, core_alpha)
         if gap_l > 0:
-            pygame.draw.rect(glow_surf, core_color,
-                             (0, y - bw, gap_l, bw * 2))
+            surface.fill(core_color, (0, y - bw, gap_l, bw * 2),
+                         special_flags=add)
         if gap_r < w:
-            pygame.draw.rect(glow_surf, core_color,
-                             (gap_r, y - bw, w - gap_r, bw * 2))
+            surface.fill(core_color, (gap_r, y - bw, w - gap_r, bw * 2),
+                         special_flags=add)
 
-        surface.blit(glow_surf, (0, 0))
-
-    def _render_v_beam(self, surface, x, gap_cy, gap_size, color, alpha_mult=1.0):
+    def _render_v_beam(self, surface, x, gap_t, gap_b, layers, alpha_mult=1.0):
         """Render a vertical beam with glow layers and gap."""
         h = surface.get_height()
-        bw = self.beam_width // 2
-        gap_t = gap_cy - gap_size // 2
-        gap_b = gap_cy + gap_size // 2
-
-        glow_surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        bw = self._bw
+        outer_bw = self._outer_bw
+        inner_bw = self._inner_bw
+        add = pygame.BLEND_RGB_ADD
+        outer_color, inner_color, core_color = _fade_layers(layers, alpha_mult)
 
         # Outer glow
-        outer_bw = bw + cfg.BEAM_OUTER_GLOW
-        outer_alpha = int(cfg.BEAM_OUTER_ALPHA * 255 * alpha_mult)
-        outer_color = (*color, outer_alpha)
         if gap_t > 0:
-            pygame.draw.rect(glow_surf, outer_color,
-                             (x - outer_bw, 0, outer_bw * 2, gap_t))
+            surface.fill(outer_color, (x - outer_bw, 0, outer_bw * 2, gap_t),
+                         special_flags=add)
         if gap_b < h:
-            pygame.draw.rect(glow_surf, outer_color,
-                             (x - outer_bw, gap_b, outer_bw * 2, h - gap_b))
+            surface.fill(outer_color, (x - outer_bw, gap_b, outer_bw * 2, h - gap_b),
+                         special_flags=add)
 
         # Inner glow
-        inner_bw = bw + cfg.BEAM_INNER_GLOW
-        inner_alpha = int(cfg.BEAM_INNER_ALPHA * 255 * alpha_mult)
-        inner_color = (*color, inner_alpha)
         if gap_t > 0:
-            pygame.draw.rect(glow_surf, inner_color,
-                             (x - inner_bw, 0, inner_bw * 2, gap_t))
+            surface.fill(inner_color, (x - inner_bw, 0, inner_bw * 2, gap_t),
+                         special_flags=add)
         if gap_b < h:
-            pygame.draw.rect(glow_surf, inner_color,
-                             (x - inner_bw, gap_b, inner_bw * 2, h - gap_b))
+            surface.fill(inner_color, (x - inner_bw, gap_b, inner_bw * 2, h - gap_b),
+                         special_flags=add)
 
         # Core
-        core_alpha = int(220 * alpha_mult)
-        core_color = (*color, core_alpha)
         if gap_t > 0:
-            pygame.draw.rect(glow_surf, core_color,
-                             (x - bw, 0, bw * 2, gap_t))
+            surface.fill(core_color, (x - bw, 0, bw * 2, gap_t),
+                         special_flags=add)
         if gap_b < h:
-            pygame.draw.rect(glow_surf, core_color,
-                             (x - bw, gap_b, bw * 2, h - gap_b))
-
-        surface.blit(glow_surf, (0, 0))
+            surface.fill(core_color, (x - bw, gap_b, bw * 2, h - gap_b),
+                         special_flags=add)
 
 
 
@@ -604,10 +734,42 @@ class LaserManager:
         self.lasers = []
         self.time_since_spawn = 0.0
 
+        # Spawn randomness is drawn in batches from a NumPy generator and
+        # consumed from a ring buffer, so each spawn costs a list index
+        # instead of several `random` module calls.
+        self._rng = np.random.default_rng()
+        self._pool = self._rng.random(RNG_POOL_SIZE).tolist()
+        self._pool_idx = 0
+
+        # Cached composite of all beams, drawn on black and added onto the
+        # game surface.  Re-rendered only when the set of lasers, a phase,
+        # or a quantized intensity level changes.
+        self._composite_surf = pygame.Surface((screen_w, screen_h))
+        self._last_rendered_state = None
+
+        # Pixel coordinates, weighted by per-row/column hit counts to get
+        # the collision centroid without building index arrays
+        self._xs = np.arange(screen_w)
+        self._ys = np.arange(screen_h)
+
+    def _uniform(self):
+        """Next float in [0, 1) from the pre-drawn pool."""
+        if self._pool_idx >= RNG_POOL_SIZE:
+            self._pool = self._rng.random(RNG_POOL_SIZE).tolist()
+            self._pool_idx = 0
+        u = self._pool[self._pool_idx]
+        self._pool_idx += 1
+        return u
+
+    def _randint(self, lo, hi):
+        """Random integer in [lo, hi], same contract as random.randint."""
+        return lo + int(self._uniform() * (hi - lo + 1))
+
     def reset(self):
         """Clear all lasers (called on game start)."""
         self.lasers.clear()
         self.time_since_spawn = 0.0
+        self._last_rendered_state = None
 
     def update(self, dt, survival_time):
         """
@@ -631,15 +793,19 @@ class LaserManager:
     def _spawn_laser(self, T):
         """Spawn a random laser, retrying if it's too close to active ones."""
         available = get_available_types(T)
-        types = [t for t, _w in available]
-        weights = [w for _t, w in available]
-        beam_type = random.choices(types, weights=weights, k=1)[0]
+        # Weighted pick: walk the cumulative weights with one pooled draw
+        pick = self._uniform() * sum(w for _t, w in available)
+        for beam_type, weight in available:
+            pick -= weight
+            if pick < 0:
+                break
 
         # Try up to 10 times to find a position with enough spacing
         best_laser = None
         best_min_dist = -1
         for _ in range(10):
-            laser = Laser(beam_type, T, self.screen_w, self.screen_h)
+            laser = Laser(beam_type, T, self.screen_w, self.screen_h,
+                          randint=self._randint)
             min_dist = self._min_distance_to_active(laser)
             if min_dist >= cfg.LASER_MIN_SPACING:
                 self.lasers.append(laser)
@@ -705,34 +871,117 @@ class LaserManager:
     def spawn_anti_camp_laser(self, target_x, T):
         """Spawn a targeted anti-camp beam at the camper's X position."""
         laser = Laser("anti_camp", T, self.screen_w, self.screen_h,
-                      target_x=target_x)
+                      target_x=target_x, randint=self._randint)
         self.lasers.append(laser)
 
-    def check_collision(self, body_mask):
+    def check_collision(self, body_mask, body_bits=None, body_bbox=None):
         """
         Check if any active laser collides with the body mask.
         Returns (collided: bool, collision_point: tuple or None,
         hit_color: tuple or None).
-        """
-        for laser in self.lasers:
-            laser_mask = laser.get_collision_mask()
-            if laser_mask is None:
-                continue
 
-            # The actual collision check: single vectorized operation
-            overlap = body_mask & laser_mask
-            if np.any(overlap):
-                # Find approximate collision point (centroid of overlap)
-                ys, xs = np.where(overlap > 0)
-                if len(xs) > 0:
-                    cx = int(np.mean(xs))
-                    cy = int(np.mean(ys))
-                    color = laser._get_primary_color()
-                    return True, (cx, cy), color
+        body_bits is an optional np.packbits(body_mask, axis=-1) copy of
+        the mask.  When given, the row/column occupancy is computed from
+        it (8x fewer bytes); the unpacked mask is then only read inside
+        candidate slices to locate the hit.
+
+        body_bbox is an optional (x0, y0, x1, y1) bounding box of the mask
+        (end exclusive).  Slices are clipped to it first, which rejects
+        beams nowhere near the player without reading the mask at all.
+
+        Each beam is a handful of axis-aligned slices, most of which span
+        the full width or height.  The mask is collapsed once into 1-D
+        row/column occupancy counts, and every active slice of every
+        laser is tested against them in one vectorized pass.  Only slices
+        that pass are scanned in 2-D, in laser order, so the earliest
+        spawned laser that is hit wins, as before.
+        """
+        rects = [(i, *rect)
+                 for i, laser in enumerate(self.lasers)
+                 for rect in laser.get_collision_rects()]
+        if not rects:
+            return False, None, None
+        rects = np.array(rects, dtype=np.int32)
+        ids, y0s, y1s, x0s, x1s = rects.T
+
+        h, w = body_mask.shape
+        by0, by1 = 0, h
+        if body_bbox is not None:
+            bx0, by0, bx1, by1 = body_bbox
+            # No body pixels lie outside the box, so clipping the slices
+            # to it changes neither the hit test nor the hit centroid
+            np.maximum(y0s, by0, out=y0s)
+            np.minimum(y1s, by1, out=y1s)
+            np.maximum(x0s, bx0, out=x0s)
+            np.minimum(x1s, bx1, out=x1s)
+            inside = (y1s > y0s) & (x1s > x0s)
+            if not inside.any():
+                return False, None, None
+            rects = rects[inside]
+            ids, y0s, y1s, x0s, x1s = rects.T
+
+        # Occupancy is only computed over the box's rows
+        rows_any = np.zeros(h, dtype=bool)
+        if body_bits is None:
+            band = body_mask[by0:by1]
+            rows_any[by0:by1] = band.any(axis=1)
+            cols_any = band.any(axis=0)
+        else:
+            band = body_bits[by0:by1]
+            rows_any[by0:by1] = band.any(axis=1)
+            cols_any = np.unpackbits(
+                np.bitwise_or.reduce(band, axis=0), count=w
+            )
+
+        # Prefix sums turn "any body row in [y0, y1)" into two lookups
+        row_cs = np.zeros(h + 1, dtype=np.int32)
+        np.cumsum(rows_any, out=row_cs[1:])
+        col_cs = np.zeros(w + 1, dtype=np.int32)
+        np.cumsum(cols_any, out=col_cs[1:])
+        candidates = ((row_cs[y1s] > row_cs[y0s]) &
+                      (col_cs[x1s] > col_cs[x0s]))
+
+        hit_id = -1
+        sum_x = sum_y = count = 0
+        for k in np.flatnonzero(candidates):
+            laser_id = ids[k]
+            if hit_id >= 0 and laser_id != hit_id:
+                break  # finished every slice of the first laser that hit
+            y0, y1, x0, x1 = int(y0s[k]), int(y1s[k]), int(x0s[k]), int(x1s[k])
+            # Body pixels inside this slice (centroid of the overlap)
+            region = body_mask[y0:y1, x0:x1]
+            col_counts = np.count_nonzero(region, axis=0)
+            n = int(col_counts.sum())
+            if n > 0:
+                hit_id = laser_id
+                row_counts = np.count_nonzero(region, axis=1)
+                sum_x += int(col_counts @ self._xs[x0:x1])
+                sum_y += int(row_counts @ self._ys[y0:y1])
+                count += n
+
+        if count > 0:
+            color = self.lasers[hit_id]._get_primary_color()
+            return True, (sum_x // count, sum_y // count), color
 
         return False, None, None
 
     def render(self, surface):
         """Draw all active lasers onto the given surface."""
-        for laser in self.lasers:
-            laser.render(surface)
+        if not self.lasers:
+            return
+
+        # Laser objects compare by identity, and holding them in the
+        # tuple keeps a replaced beam from matching a new one.
+        levels = [laser.render_level() for laser in self.lasers]
+        state = tuple((laser, laser.phase, level)
+                      for laser, level in zip(self.lasers, levels))
+
+        if state != self._last_rendered_state:
+            self._composite_surf.fill((0, 0, 0))
+            for laser, level in zip(self.lasers, levels):
+                laser.render(self._composite_surf, level)
+            self._last_rendered_state = state
+
+        # Black adds nothing, so no colorkey or per-pixel alpha is needed
+        surface.blit(self._composite_surf, (0, 0),
+                     special_flags=pygame.BLEND_RGB_ADD)
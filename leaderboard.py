@@ -1,14 +1,18 @@
 """
-leaderboard.py — Persistent top-scores storage using a JSON file.
+leaderboard.py — Persistent top-scores storage using a binary file.
 
 The leaderboard stores the top N survival times, sorted descending
 (longest survival = best).  It persists between application restarts
-via a simple JSON file.  All read/write operations are wrapped in
-try/except so a corrupted file never crashes the application.
+as N little-endian float32 slots (40 bytes for a top-10), written in
+one call and swapped into place atomically.  A leftover JSON score file
+from older versions is migrated on first load.  All read/write
+operations are wrapped in try/except so a corrupted file never crashes
+the application.
 """
 
 import json
 import os
+import struct
 import threading
 
 import requests
@@ -17,6 +21,9 @@ import config as cfg
 
 LEADERBOARD_SERVER_URL = "http://10.168.121.158:3000/leaderboard/update"
 
+# Marks an unused slot in the fixed-size score file (times are never negative)
+EMPTY_SLOT = -1.0
+
 
 def send_to_leaderboard_server(player, timing, category):
     """
@@ -61,17 +68,41 @@ class Leaderboard:
     def __init__(self, filepath=None):
         self.filepath = filepath or cfg.LEADERBOARD_FILE
         self.max_entries = cfg.LEADERBOARD_MAX_ENTRIES
+        self._format = f"<{self.max_entries}f"
         self.scores = self._load()
 
     def _load(self):
         """
-        Load scores from the JSON file.  If the file doesn't exist or
-        is corrupted, return an empty list rather than crashing.
+        Load scores from the binary file, migrating the legacy JSON file
+        if that is all there is.  If neither exists or the data is
+        corrupted, return an empty list rather than crashing.
         """
         if not os.path.exists(self.filepath):
+            scores = self._load_legacy_json()
+            if scores:
+                self.scores = scores
+                self._save()
+            return scores
+        try:
+            with open(self.filepath, "rb") as f:
+                data = f.read()
+            # Tolerate files written with a different max_entries
+            count = len(data) // 4
+            values = struct.unpack(f"<{count}f", data[:count * 4])
+            # Scores are kept to 0.1s; rounding undoes float32 error
+            return sorted([round(v, 1) for v in values if v >= 0],
+                          reverse=True)[:self.max_entries]
+        except (struct.error, IOError):
+            pass
+        return []
+
+    def _load_legacy_json(self):
+        """Read scores from the pre-binary JSON file next to filepath."""
+        legacy_path = os.path.splitext(self.filepath)[0] + ".json"
+        if legacy_path == self.filepath or not os.path.exists(legacy_path):
             return []
         try:
-            with open(self.filepath, "r") as f:
+            with open(legacy_path, "r") as f:
                 data = json.load(f)
             # Validate: must be a list of numbers
             if isinstance(data, list):
@@ -83,9 +114,12 @@ class Leaderboard:
 
     def _save(self):
         """Write scores to disk.  Silently fails on I/O error."""
+        padded = self.scores + [EMPTY_SLOT] * (self.max_entries - len(self.scores))
+        tmp_path = self.filepath + ".tmp"
         try:
-            with open(self.filepath, "w") as f:
-                json.dump(self.scores, f, indent=2)
+            with open(tmp_path, "wb") as f:
+                f.write(struct.pack(self._format, *padded))
+            os.replace(tmp_path, self.filepath)
         except IOError:
             pass  # Non-fatal: we just lose persistence
 
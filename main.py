@@ -23,6 +23,7 @@ Operator controls:
   1-4     — Force difficulty tier
 """
 
+import os
 import sys
 import time
 
@@ -50,10 +51,15 @@ def main():
     # ── Display setup ──
     # We render everything at internal resolution (640×480) onto an
     # off-screen surface, then scale it up to the display resolution
-    # (1920×1080 or whatever the TV supports).  This keeps all game
+    # (1920×1080 or whatever the TV supports) — on the GPU via
+    # pygame.SCALED by default, or with a CPU smoothscale.  This keeps all game
     # logic and collision detection at a fixed, predictable resolution.
 
-    if cfg.FULLSCREEN:
+    if cfg.GPU_SCALING:
+        # The window is created at internal resolution and SDL's renderer
+        # does the upscale on the GPU, so no per-frame CPU scaling pass.
+        display = _create_scaled_display()
+    elif cfg.FULLSCREEN:
         # Use the native monitor resolution so the game fills the screen
         # regardless of the user's display (1080p, 1440p, 4K, etc.).
         screen_info = pygame.display.Info()
@@ -79,6 +85,12 @@ def main():
         (cfg.INTERNAL_WIDTH, cfg.INTERNAL_HEIGHT), pygame.SRCALPHA
     )
 
+    # CPU scaling path: reuse one display-sized destination every frame
+    # instead of letting smoothscale allocate a new surface
+    scaled_buf = None
+    if not cfg.GPU_SCALING:
+        scaled_buf = pygame.Surface(display.get_size(), pygame.SRCALPHA)
+
     clock = pygame.time.Clock()
 
     # ── Initialize all game modules ──
@@ -101,6 +113,58 @@ def main():
     body_lost_frames = 0      # Consecutive frames without body during gameplay
     last_frame_time = time.time()
 
+    # ── Operator key handlers ──
+    # Built once so each KEYDOWN is a single dict lookup instead of a
+    # chain of comparisons against pygame.K_* attributes.
+    def _quit(event):
+        nonlocal running
+        running = False
+
+    def _toggle_pause(event):
+        game_state.toggle_pause()
+        _play_sound(sounds, "beep")
+
+    def _toggle_fps(event):
+        nonlocal show_fps
+        show_fps = not show_fps
+
+    def _toggle_debug_mask(event):
+        nonlocal show_debug_mask
+        show_debug_mask = not show_debug_mask
+
+    def _reset_leaderboard(event):
+        if event.mod & pygame.KMOD_CTRL:
+            leaderboard.reset()
+            print("[Dodge the Lasers] Leaderboard reset.")
+
+    def _force_difficulty(event):
+        tier = DIFFICULTY_KEYS[event.key]
+        game_state.forced_difficulty = tier
+        print(f"[Debug] Forced difficulty tier: {tier}")
+
+    def _auto_difficulty(event):
+        game_state.forced_difficulty = None
+        print("[Debug] Difficulty set to auto.")
+
+    def _start_game(event):
+        # Start the game from the instructions screen
+        game_state.start_game()
+        _play_sound(sounds, "beep")
+
+    # Force difficulty tiers (operator keys)
+    DIFFICULTY_KEYS = {pygame.K_1: 1, pygame.K_2: 2, pygame.K_3: 3, pygame.K_4: 4}
+
+    KEY_HANDLERS = {
+        pygame.K_ESCAPE: _quit,
+        pygame.K_p: _toggle_pause,
+        pygame.K_f: _toggle_fps,
+        pygame.K_d: _toggle_debug_mask,
+        pygame.K_r: _reset_leaderboard,
+        pygame.K_0: _auto_difficulty,
+        pygame.K_RETURN: _start_game,
+    }
+    KEY_HANDLERS.update(dict.fromkeys(DIFFICULTY_KEYS, _force_difficulty))
+
     # ── Start the camera thread ──
     camera.start()
     print("[Dodge the Lasers] Camera thread started. Game running.")
@@ -110,9 +174,27 @@ def main():
     # MAIN GAME LOOP
     # ══════════════════════════════════════════════════════════════
 
+    # ── Loop invariants ──
+    # Bound once as locals: each cfg.*, State.* or pygame.* reference in
+    # the per-frame path is otherwise a global plus attribute lookup.
+    COLOR_BG = cfg.COLOR_BACKGROUND
+    TARGET_FPS = cfg.TARGET_FPS
+    BODY_LOST_HINT_FRAMES = cfg.BODY_LOST_HINT_FRAMES
+    QUIT, KEYDOWN = pygame.QUIT, pygame.KEYDOWN
+    S_IDLE, S_PAUSED = State.IDLE, State.PAUSED
+    S_INSTRUCTIONS, S_COUNTDOWN = State.INSTRUCTIONS, State.COUNTDOWN
+    S_PLAYING, S_HIT, S_GAME_OVER = State.PLAYING, State.HIT, State.GAME_OVER
+    IN_PLAY = (S_PLAYING, S_HIT)
+    LASER_STATES = (S_PLAYING, S_HIT, S_GAME_OVER)
+    BODY_STATES = (S_INSTRUCTIONS, S_COUNTDOWN, S_PLAYING, S_HIT)
+    get_time = time.time
+    event_get = pygame.event.get
+    surface_fill = game_surface.fill
+    clock_tick = clock.tick
+
     running = True
     while running:
-        now = time.time()
+        now = get_time()
         dt = now - last_frame_time
         last_frame_time = now
         # Clamp dt to prevent physics explosions after a pause/lag spike
@@ -121,56 +203,28 @@ def main():
         # ────────────────────────────────────────────────────────
         # STEP 0: Process input events
         # ────────────────────────────────────────────────────────
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        for event in event_get():
+            if event.type == QUIT:
                 running = False
 
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-
-                elif event.key == pygame.K_p:
-                    game_state.toggle_pause()
-                    _play_sound(sounds, "beep")
-
-                elif event.key == pygame.K_f:
-                    show_fps = not show_fps
-
-                elif event.key == pygame.K_d:
-                    show_debug_mask = not show_debug_mask
-
-                elif event.key == pygame.K_r and pygame.key.get_mods() & pygame.KMOD_CTRL:
-                    leaderboard.reset()
-                    print("[Dodge the Lasers] Leaderboard reset.")
-
-                # Force difficulty tiers (operator keys)
-                elif event.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4):
-                    tier = event.key - pygame.K_0
-                    game_state.forced_difficulty = tier
-                    print(f"[Debug] Forced difficulty tier: {tier}")
-
-                elif event.key == pygame.K_0:
-                    game_state.forced_difficulty = None
-                    print("[Debug] Difficulty set to auto.")
-
-                elif event.key == pygame.K_RETURN:
-                    # Start the game from the instructions screen
-                    game_state.start_game()
-                    _play_sound(sounds, "beep")
+            elif event.type == KEYDOWN:
+                handler = KEY_HANDLERS.get(event.key)
+                if handler is not None:
+                    handler(event)
 
         # Don't update anything while paused
-        if game_state.state == State.PAUSED:
-            game_surface.fill(cfg.COLOR_BACKGROUND)
+        if game_state.state == S_PAUSED:
+            surface_fill(COLOR_BG)
             hud.render(game_surface, game_state, leaderboard.get_scores())
-            _scale_and_flip(game_surface, display)
-            clock.tick(cfg.TARGET_FPS)
+            _scale_and_flip(game_surface, display, scaled_buf)
+            clock_tick(TARGET_FPS)
             continue
 
         # ────────────────────────────────────────────────────────
         # STEP 1: Read body mask from camera (non-blocking)
         # ────────────────────────────────────────────────────────
-        body_mask, body_detected = camera.get_body_mask()
-        collision_mask = camera.get_collision_mask()
+        body_mask, body_detected, mask_version = camera.get_body_mask()
+        collision_mask, collision_bits, collision_bbox = camera.get_collision_mask()
 
         # ── Compute body centroid for anti-camping ──
         if body_detected:
@@ -191,19 +245,19 @@ def main():
         # ── State transition side-effects ──
 
         # Entering COUNTDOWN → reset lasers and particles
-        if game_state.state == State.COUNTDOWN and prev_state == State.INSTRUCTIONS:
+        if game_state.state == S_COUNTDOWN and prev_state == S_INSTRUCTIONS:
             laser_mgr.reset()
             particles.clear()
             _play_sound(sounds, "beep")
 
         # Entering PLAYING from COUNTDOWN → game starts
-        if game_state.state == State.PLAYING and prev_state == State.COUNTDOWN:
+        if game_state.state == S_PLAYING and prev_state == S_COUNTDOWN:
             _play_sound(sounds, "start")
 
         # ────────────────────────────────────────────────────────
         # STEP 3 & 4: Spawn and update lasers
         # ────────────────────────────────────────────────────────
-        if game_state.state in (State.PLAYING, State.HIT):
+        if game_state.state in IN_PLAY:
             laser_mgr.update(dt, game_state.survival_time)
 
             # Anti-camping: fire targeted laser if camper didn't move
@@ -214,8 +268,10 @@ def main():
         # ────────────────────────────────────────────────────────
         # STEP 5: Collision detection
         # ────────────────────────────────────────────────────────
-        if game_state.state in (State.PLAYING, State.HIT) and not game_state.is_invincible:
-            collided, hit_point, hit_color = laser_mgr.check_collision(collision_mask)
+        if game_state.state in IN_PLAY and not game_state.is_invincible:
+            collided, hit_point, hit_color = laser_mgr.check_collision(
+                collision_mask, collision_bits, collision_bbox
+            )
 
             if collided:
                 alive = game_state.register_hit()
@@ -232,7 +288,7 @@ def main():
         # ── GAME_OVER transition side-effects ──
         # Checked here (after collision) so we catch game overs triggered
         # by both body-lost (in update()) AND collision (in register_hit()).
-        if game_state.state == State.GAME_OVER and prev_state in (State.PLAYING, State.HIT):
+        if game_state.state == S_GAME_OVER and prev_state in IN_PLAY:
             rank, is_highscore = leaderboard.submit(game_state.final_time)
             game_state.set_game_over_result(rank, is_highscore)
             # Send score to the central leaderboard server (non-blocking)
@@ -261,30 +317,32 @@ def main():
         # ────────────────────────────────────────────────────────
 
         # 7a. Clear to background color
-        game_surface.fill(cfg.COLOR_BACKGROUND)
+        surface_fill(COLOR_BG)
 
         # 7b. Draw laser beams (behind the body)
-        if game_state.state in (State.PLAYING, State.HIT, State.GAME_OVER):
+        if game_state.state in LASER_STATES:
             laser_mgr.render(game_surface)
 
         # 7c. Draw the player's neon body silhouette
-        if body_detected and game_state.state in (State.INSTRUCTIONS, State.COUNTDOWN, State.PLAYING, State.HIT):
+        if body_detected and game_state.state in BODY_STATES:
             body_surface = player_renderer.render_body(
                 body_mask,
                 is_invincible=game_state.is_invincible,
                 time_now=now,
+                version=mask_version,
             )
             game_surface.blit(body_surface, (0, 0))
 
         # Also show body on idle screen (so approaching visitors see themselves)
-        if body_detected and game_state.state == State.IDLE:
+        if body_detected and game_state.state == S_IDLE:
             # Dimmer version on idle
-            body_surface = player_renderer.render_body(body_mask, time_now=now)
-            body_surface.set_alpha(80)
+            body_surface = player_renderer.render_body_dim(
+                body_mask, now, version=mask_version
+            )
             game_surface.blit(body_surface, (0, 0))
 
         # 7c2. Draw anti-camping reticle (on top of lasers, below body)
-        if game_state.camp_warning_active and game_state.state in (State.PLAYING, State.HIT):
+        if game_state.camp_warning_active and game_state.state in IN_PLAY:
             hud.render_camp_warning(game_surface,
                                     game_state.camp_target_x,
                                     game_state.camp_target_y)
@@ -296,9 +354,9 @@ def main():
         hud.render(game_surface, game_state, leaderboard.get_scores())
 
         # 7f. Body-lost hint during gameplay
-        if game_state.state in (State.PLAYING, State.HIT) and not body_detected:
+        if game_state.state in IN_PLAY and not body_detected:
             body_lost_frames += 1
-            if body_lost_frames > cfg.BODY_LOST_HINT_FRAMES:
+            if body_lost_frames > BODY_LOST_HINT_FRAMES:
                 hud.render_body_lost_hint(game_surface)
         else:
             body_lost_frames = 0
@@ -313,8 +371,8 @@ def main():
         # ────────────────────────────────────────────────────────
         # STEP 8: Scale to display resolution and flip
         # ────────────────────────────────────────────────────────
-        _scale_and_flip(game_surface, display)
-        clock.tick(cfg.TARGET_FPS)
+        _scale_and_flip(game_surface, display, scaled_buf)
+        clock_tick(TARGET_FPS)
 
     # ══════════════════════════════════════════════════════════════
     # CLEANUP
@@ -329,17 +387,41 @@ def main():
 # Helper functions
 # ══════════════════════════════════════════════════════════════════
 
-def _scale_and_flip(game_surface, display):
+def _create_scaled_display():
     """
-    Scale the internal-resolution game surface up to the display
-    resolution and present it.  Uses smoothscale for bilinear
-    filtering so the upscaled image isn't blocky/grainy.
+    Open a pygame.SCALED display at internal resolution.  SDL's renderer
+    upscales it to the window/monitor on the GPU.  Linear filtering is
+    requested (unless overridden in the environment) to match the look of
+    smoothscale; vsync is used when the driver supports it.
     """
-    scaled = pygame.transform.smoothscale(
-        game_surface,
-        display.get_size(),
-    )
-    display.blit(scaled, (0, 0))
+    os.environ.setdefault("SDL_RENDER_SCALE_QUALITY", "linear")
+    flags = pygame.SCALED | pygame.DOUBLEBUF
+    if cfg.FULLSCREEN:
+        flags |= pygame.FULLSCREEN
+    size = (cfg.INTERNAL_WIDTH, cfg.INTERNAL_HEIGHT)
+    try:
+        return pygame.display.set_mode(size, flags, vsync=1)
+    except pygame.error:
+        # No vsync on this driver — clock.tick() still caps the frame rate
+        return pygame.display.set_mode(size, flags)
+
+
+def _scale_and_flip(game_surface, display, scaled_buf=None):
+    """
+    Present the internal-resolution game surface.  With a SCALED display
+    (scaled_buf is None) it is copied as-is and SDL upscales on the GPU.
+    Otherwise it is smoothscaled into the preallocated scaled_buf for
+    bilinear filtering so the upscaled image isn't blocky/grainy.
+    """
+    if scaled_buf is None:
+        display.blit(game_surface, (0, 0))
+    else:
+        pygame.transform.smoothscale(
+            game_surface,
+            scaled_buf.get_size(),
+            scaled_buf,
+        )
+        display.blit(scaled_buf, (0, 0))
     pygame.display.flip()
 
 
@@ -353,17 +435,19 @@ def _render_debug_mask(surface, body_mask, collision_mask):
     pw = int(cfg.INTERNAL_WIDTH * scale)
     ph = int(cfg.INTERNAL_HEIGHT * scale)
 
-    debug_surf = pygame.Surface((pw, ph), pygame.SRCALPHA)
+    # Nearest-neighbour downsample by striding, then color with boolean
+    # masks in one pass instead of a per-pixel set_at loop
+    step = int(round(1 / scale))
+    body_small = body_mask[::step, ::step][:ph, :pw]
+    coll_small = collision_mask[::step, ::step][:ph, :pw]
+    sh, sw = body_small.shape
+
+    rgba = np.zeros((ph, pw, 4), dtype=np.uint8)
+    view = rgba[:sh, :sw]
+    view[body_small > 0] = (0, 255, 0, 100)       # Body mask in green
+    view[coll_small > 0] = (255, 0, 0, 150)       # Collision mask in red
 
-    # Body mask in green
-    for y in range(ph):
-        for x in range(pw):
-            oy, ox = int(y / scale), int(x / scale)
-            if oy < body_mask.shape[0] and ox < body_mask.shape[1]:
-                if body_mask[oy, ox] > 0:
-                    debug_surf.set_at((x, y), (0, 255, 0, 100))
-                if collision_mask[oy, ox] > 0:
-                    debug_surf.set_at((x, y), (255, 0, 0, 150))
+    debug_surf = pygame.image.frombuffer(rgba.tobytes(), (pw, ph), "RGBA")
 
     surface.blit(debug_surf, (5, surface.get_height() - ph - 5))
 
@@ -379,88 +463,69 @@ def _load_sounds():
         return sounds
 
     # We generate simple beep sounds programmatically so there are
-    # no external WAV files required for the MVP.
+    # no external WAV files required for the MVP.  Each waveform is
+    # computed over the whole sample-time array at once.
     try:
-        import array
-
         sample_rate = 22050
 
         # Beep sound (countdown, UI feedback)
         beep_freq = 880
         beep_duration = 0.15
-        beep_samples = int(sample_rate * beep_duration)
-        beep_buf = array.array("h", [0] * beep_samples)
-        for i in range(beep_samples):
-            t = i / sample_rate
-            # Sine wave with quick fade-out envelope
-            envelope = max(0, 1.0 - t / beep_duration)
-            val = int(16000 * envelope * np.sin(2 * np.pi * beep_freq * t))
-            beep_buf[i] = max(-32768, min(32767, val))
-        beep_sound = pygame.mixer.Sound(buffer=beep_buf)
+        t = _sample_times(beep_duration, sample_rate)
+        # Sine wave with quick fade-out envelope
+        envelope = np.maximum(0, 1.0 - t / beep_duration)
+        wave = 16000 * envelope * np.sin(2 * np.pi * beep_freq * t)
+        beep_sound = pygame.mixer.Sound(buffer=_to_pcm16(wave))
         beep_sound.set_volume(cfg.AUDIO_VOLUME * 0.5)
         sounds["beep"] = beep_sound
 
         # Hit sound (zap/buzz)
         hit_duration = 0.25
-        hit_samples = int(sample_rate * hit_duration)
-        hit_buf = array.array("h", [0] * hit_samples)
-        for i in range(hit_samples):
-            t = i / sample_rate
-            envelope = max(0, 1.0 - t / hit_duration)
-            # Distorted buzz: mix of frequencies for a "zap" feel
-            val = int(12000 * envelope * (
-                np.sin(2 * np.pi * 150 * t) +
-                0.5 * np.sin(2 * np.pi * 300 * t) +
-                0.3 * np.random.uniform(-1, 1)
-            ))
-            hit_buf[i] = max(-32768, min(32767, val))
-        hit_sound = pygame.mixer.Sound(buffer=hit_buf)
+        t = _sample_times(hit_duration, sample_rate)
+        envelope = np.maximum(0, 1.0 - t / hit_duration)
+        # Distorted buzz: mix of frequencies for a "zap" feel
+        wave = 12000 * envelope * (
+            np.sin(2 * np.pi * 150 * t) +
+            0.5 * np.sin(2 * np.pi * 300 * t) +
+            0.3 * np.random.uniform(-1, 1, len(t))
+        )
+        hit_sound = pygame.mixer.Sound(buffer=_to_pcm16(wave))
         hit_sound.set_volume(cfg.AUDIO_VOLUME * 0.7)
         sounds["hit"] = hit_sound
 
         # Game start sound (ascending tone)
         start_duration = 0.4
-        start_samples = int(sample_rate * start_duration)
-        start_buf = array.array("h", [0] * start_samples)
-        for i in range(start_samples):
-            t = i / sample_rate
-            freq = 400 + (t / start_duration) * 800  # Sweep 400→1200 Hz
-            envelope = min(1.0, t / 0.05) * max(0, 1.0 - t / start_duration)
-            val = int(14000 * envelope * np.sin(2 * np.pi * freq * t))
-            start_buf[i] = max(-32768, min(32767, val))
-        start_sound = pygame.mixer.Sound(buffer=start_buf)
+        t = _sample_times(start_duration, sample_rate)
+        freq = 400 + (t / start_duration) * 800  # Sweep 400→1200 Hz
+        envelope = (np.minimum(1.0, t / 0.05)
+                    * np.maximum(0, 1.0 - t / start_duration))
+        wave = 14000 * envelope * np.sin(_sweep_phase(freq, sample_rate))
+        start_sound = pygame.mixer.Sound(buffer=_to_pcm16(wave))
         start_sound.set_volume(cfg.AUDIO_VOLUME * 0.6)
         sounds["start"] = start_sound
 
         # Game over sound (descending tone)
         go_duration = 0.6
-        go_samples = int(sample_rate * go_duration)
-        go_buf = array.array("h", [0] * go_samples)
-        for i in range(go_samples):
-            t = i / sample_rate
-            freq = 800 - (t / go_duration) * 600  # Sweep 800→200 Hz
-            envelope = max(0, 1.0 - t / go_duration)
-            val = int(14000 * envelope * np.sin(2 * np.pi * freq * t))
-            go_buf[i] = max(-32768, min(32767, val))
-        go_sound = pygame.mixer.Sound(buffer=go_buf)
+        t = _sample_times(go_duration, sample_rate)
+        freq = 800 - (t / go_duration) * 600  # Sweep 800→200 Hz
+        envelope = np.maximum(0, 1.0 - t / go_duration)
+        wave = 14000 * envelope * np.sin(_sweep_phase(freq, sample_rate))
+        go_sound = pygame.mixer.Sound(buffer=_to_pcm16(wave))
         go_sound.set_volume(cfg.AUDIO_VOLUME * 0.6)
         sounds["gameover"] = go_sound
 
         # High score celebration (major chord)
         hs_duration = 1.0
-        hs_samples = int(sample_rate * hs_duration)
-        hs_buf = array.array("h", [0] * hs_samples)
-        for i in range(hs_samples):
-            t = i / sample_rate
-            envelope = min(1.0, t / 0.05) * max(0, 1.0 - (t / hs_duration) ** 0.5)
-            # Major chord: root + major third + fifth
-            val = int(10000 * envelope * (
-                np.sin(2 * np.pi * 523.25 * t) +  # C5
-                np.sin(2 * np.pi * 659.25 * t) +  # E5
-                np.sin(2 * np.pi * 783.99 * t)     # G5
-            ))
-            hs_buf[i] = max(-32768, min(32767, val))
-        hs_sound = pygame.mixer.Sound(buffer=hs_buf)
+        t = _sample_times(hs_duration, sample_rate)
+        envelope = (np.minimum(1.0, t / 0.05)
+                    * np.maximum(0, 1.0 - (t / hs_duration) ** 0.5))
+        # Major chord: root + major third + fifth
+        wave = 10000 * envelope * (
+            np.sin(2 * np.pi * 523.25 * t) +  # C5
+            np.sin(2 * np.pi * 659.25 * t) +  # E5
+            np.sin(2 * np.pi * 783.99 * t)     # G5
+        )
+        hs_sound = pygame.mixer.Sound(buffer=_to_pcm16(wave))
         hs_sound.set_volume(cfg.AUDIO_VOLUME * 0.8)
         sounds["highscore"] = hs_sound
 
@@ -473,6 +538,33 @@ def _load_sounds():
     return sounds
 
 
+def _sample_times(duration, sample_rate):
+    """Sample timestamps (seconds) for a sound of the given duration."""
+    return np.arange(int(sample_rate * duration)) / sample_rate
+
+
+def _sweep_phase(freq, sample_rate):
+    """
+    Phase (radians) of a tone whose frequency changes per sample.
+    Integrating the frequency keeps the sweep continuous and makes it
+    actually span the requested start→end range.
+    """
+    phase = np.cumsum(freq) * (2 * np.pi / sample_rate)
+    # Start at phase 0 like the fixed-frequency tones
+    phase -= phase[0]
+    return phase
+
+
+def _to_pcm16(wave):
+    """
+    Clamp a float waveform to the int16 range (in place) and return it
+    as an int16 array.  pygame.mixer.Sound reads it directly through the
+    buffer protocol, so no Python-level sample handling is involved.
+    """
+    np.clip(wave, -32768, 32767, out=wave)
+    return wave.astype(np.int16)
+
+
 def _play_sound(sounds, name):
     """Play a sound by name if it exists. Never crashes."""
     try:
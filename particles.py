@@ -15,10 +15,18 @@ import pygame
 import config as cfg
 
 
+# Particle fade is quantized to this many alpha steps so pre-rendered
+# sprites can be reused instead of rasterizing a circle per particle
+ALPHA_BUCKETS = 16
+
+TWO_PI = np.float32(2 * np.pi)
+
+
 class ParticleSystem:
     """
     Manages a pool of particles.  Pre-allocates arrays for the maximum
-    count and tracks which slots are alive via a lifetime array.
+    count and tracks which slots are alive via a lifetime array.  Free
+    slots are kept on a stack so bursts never overwrite live particles.
 
     Usage:
         ps = ParticleSystem()
@@ -30,12 +38,16 @@ class ParticleSystem:
     def __init__(self, max_count=None):
         self.max_count = max_count or cfg.PARTICLE_MAX_COUNT
 
-        # Pre-allocate arrays (all particles, alive or dead)
-        self.x = np.zeros(self.max_count, dtype=np.float32)
-        self.y = np.zeros(self.max_count, dtype=np.float32)
-        self.vx = np.zeros(self.max_count, dtype=np.float32)
-        self.vy = np.zeros(self.max_count, dtype=np.float32)
-        self.lifetime = np.zeros(self.max_count, dtype=np.float32)  # <= 0 = dead
+        # Pre-allocate arrays (all particles, alive or dead).
+        # The fields touched every physics step live side by side in one
+        # (max_count, 5) block: x, y, vx, vy, lifetime.  The named
+        # attributes are column views into it.
+        self.state = np.zeros((self.max_count, 5), dtype=np.float32)
+        self.x = self.state[:, 0]
+        self.y = self.state[:, 1]
+        self.vx = self.state[:, 2]
+        self.vy = self.state[:, 3]
+        self.lifetime = self.state[:, 4]  # <= 0 = dead
         self.max_lifetime = np.zeros(self.max_count, dtype=np.float32)
 
         # Color per particle (R, G, B) — stored as separate arrays for speed
@@ -46,8 +58,21 @@ class ParticleSystem:
         # Size per particle
         self.size = np.ones(self.max_count, dtype=np.int32) * 2
 
-        # Pointer to the next free slot (round-robin allocation)
-        self._next_slot = 0
+        # Stack of free slot indices: the top _free_top entries are free.
+        # _alive marks slots handed out by emit() and not yet reclaimed,
+        # so update() can push back exactly the ones that just died.
+        self._free_stack = np.arange(self.max_count, dtype=np.int32)
+        self._free_top = self.max_count
+        self._alive = np.zeros(self.max_count, dtype=bool)
+
+        # Dedicated generator: every burst draws all its randomness in
+        # one call instead of going through the legacy global RandomState
+        self._rng = np.random.default_rng()
+
+        # Pre-rendered circle sprites keyed by (r, g, b, radius, alpha_bucket).
+        # Colors come from a small palette and radii from a narrow range,
+        # so this stays at a few hundred tiny surfaces at most.
+        self._sprite_cache = {}
 
     def emit(self, x, y, count, color, speed_min=None, speed_max=None):
         """
@@ -60,27 +85,31 @@ class ParticleSystem:
         speed_min = speed_min or cfg.PARTICLE_SPEED_MIN
         speed_max = speed_max or cfg.PARTICLE_SPEED_MAX
 
-        # Find slots to fill (overwrite dead or oldest particles)
-        count = min(count, self.max_count)
-        indices = np.arange(self._next_slot, self._next_slot + count) % self.max_count
-        self._next_slot = (self._next_slot + count) % self.max_count
+        # Pop free slots; when the pool is full the excess is dropped
+        # rather than cutting live particles short
+        n = min(count, self._free_top)
+        if n == 0:
+            return
+        top = self._free_top
+        indices = self._free_stack[top - n:top].copy()
+        self._free_top = top - n
+        self._alive[indices] = True
 
-        n = len(indices)
+        # One draw of uniform [0, 1) numbers per particle:
+        # angle, speed, lifetime, size
+        rnd = self._rng.random((n, 4), dtype=np.float32)
 
         # Random angles and speeds for radial burst
-        angles = np.random.uniform(0, 2 * np.pi, n).astype(np.float32)
-        speeds = np.random.uniform(speed_min, speed_max, n).astype(np.float32)
+        angles = rnd[:, 0] * TWO_PI
+        speeds = speed_min + rnd[:, 1] * (speed_max - speed_min)
 
         self.x[indices] = x
         self.y[indices] = y
         self.vx[indices] = np.cos(angles) * speeds
         self.vy[indices] = np.sin(angles) * speeds
 
-        lifetimes = np.random.uniform(
-            cfg.PARTICLE_LIFETIME * 0.5,
-            cfg.PARTICLE_LIFETIME,
-            n,
-        ).astype(np.float32)
+        # Lifetime uniform in [0.5, 1) x PARTICLE_LIFETIME
+        lifetimes = cfg.PARTICLE_LIFETIME * (0.5 + 0.5 * rnd[:, 2])
         self.lifetime[indices] = lifetimes
         self.max_lifetime[indices] = lifetimes
 
@@ -88,38 +117,50 @@ class ParticleSystem:
         self.g[indices] = color[1]
         self.b[indices] = color[2]
 
-        self.size[indices] = np.random.randint(
-            cfg.PARTICLE_SIZE_MIN, cfg.PARTICLE_SIZE_MAX + 1, n
+        size_span = cfg.PARTICLE_SIZE_MAX - cfg.PARTICLE_SIZE_MIN + 1
+        self.size[indices] = (
+            (rnd[:, 3] * size_span).astype(np.int32) + cfg.PARTICLE_SIZE_MIN
         )
 
     def update(self, dt):
         """
         Physics step: move particles, apply drag, decay lifetime.
         All operations are vectorized — no Python loops.
+
+        The whole pool is integrated without an alive mask: dead
+        particles are never drawn and emit() overwrites their state, so
+        stepping them is harmless and avoids masked gather/scatter.
         """
-        # Find alive particles
-        alive = self.lifetime > 0
+        state = self.state
 
         # Move
-        self.x[alive] += self.vx[alive]
-        self.y[alive] += self.vy[alive]
+        state[:, 0:2] += state[:, 2:4]
 
         # Drag (friction)
-        self.vx[alive] *= cfg.PARTICLE_DRAG
-        self.vy[alive] *= cfg.PARTICLE_DRAG
+        state[:, 2:4] *= cfg.PARTICLE_DRAG
 
         # Slight gravity for a natural arc
-        self.vy[alive] += 0.15
+        state[:, 3] += 0.15
 
         # Decay lifetime
-        self.lifetime[alive] -= dt
+        state[:, 4] -= dt
+        # Clamp so dead particles don't drift further negative forever
+        np.maximum(self.lifetime, 0.0, out=self.lifetime)
+
+        # Return slots that died this step to the free stack
+        died = np.flatnonzero(self._alive & (self.lifetime <= 0))
+        if len(died):
+            top = self._free_top
+            self._free_stack[top:top + len(died)] = died
+            self._free_top = top + len(died)
+            self._alive[died] = False
 
     def render(self, surface):
         """
         Draw all alive particles onto the PyGame surface.
-        Uses pygame.draw.circle for each alive particle.
-        This is the one place we have a Python loop, but it's bounded
-        by the alive count (typically 200-500 at peak), not the total pool.
+        Each particle is a cached circle sprite added onto the target
+        (neon-style glow); the whole batch goes to pygame in a single
+        blits() call, so there is no per-particle Python->C round trip.
         """
         alive_mask = self.lifetime > 0
         indices = np.where(alive_mask)[0]
@@ -127,38 +168,62 @@ class ParticleSystem:
         if len(indices) == 0:
             return
 
-        # Pre-compute alpha based on remaining lifetime fraction
+        # Pre-compute alpha bucket based on remaining lifetime fraction
         fracs = self.lifetime[indices] / np.maximum(self.max_lifetime[indices], 0.01)
-        fracs = np.clip(fracs, 0, 1)
+        buckets = np.rint(np.clip(fracs, 0, 1) * ALPHA_BUCKETS).astype(np.int32)
 
         # Batch extract values for the loop
-        xs = self.x[indices].astype(int)
-        ys = self.y[indices].astype(int)
-        rs = self.r[indices]
-        gs = self.g[indices]
-        bs = self.b[indices]
-        sizes = self.size[indices]
+        xs = self.x[indices].astype(np.int32)
+        ys = self.y[indices].astype(np.int32)
+        sizes = np.maximum(self.size[indices], 1)
 
         sw, sh = surface.get_size()
+        visible = (buckets > 0) & (xs >= 0) & (xs < sw) & (ys >= 0) & (ys < sh)
+        if not visible.any():
+            return
+        indices = indices[visible]
+        radii = sizes[visible]
+
+        keys = list(zip(
+            self.r[indices].tolist(), self.g[indices].tolist(),
+            self.b[indices].tolist(), radii.tolist(),
+            buckets[visible].tolist(),
+        ))
+        cache = self._sprite_cache
+        for key in set(keys).difference(cache):
+            self._build_sprite(key)
+
+        add = pygame.BLEND_RGB_ADD
+        surface.blits(
+            [(cache[key], (px, py), None, add)
+             for key, px, py in zip(keys, (xs[visible] - radii).tolist(),
+                                    (ys[visible] - radii).tolist())],
+            doreturn=False,
+        )
 
-        # Create an alpha surface for soft particles
-        alpha_surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-
-        for i in range(len(indices)):
-            px, py = int(xs[i]), int(ys[i])
-            if 0 <= px < sw and 0 <= py < sh:
-                alpha = int(fracs[i] * 255)
-                color = (int(rs[i]), int(gs[i]), int(bs[i]), alpha)
-                radius = max(1, int(sizes[i]))
-                pygame.draw.circle(alpha_surf, color, (px, py), radius)
-
-        surface.blit(alpha_surf, (0, 0))
+    def _build_sprite(self, key):
+        """
+        Rasterize and cache one particle circle.  Sprites are opaque with
+        a black background and the fade baked into the color, so an
+        additive blit leaves everything outside the circle untouched.
+        """
+        r, g, b, radius, bucket = key
+        fade = min(1.0, bucket / ALPHA_BUCKETS)
+        size = radius * 2 + 1
+        sprite = pygame.Surface((size, size))
+        pygame.draw.circle(sprite, (int(r * fade), int(g * fade), int(b * fade)),
+                           (radius, radius), radius)
+        self._sprite_cache[key] = sprite
+        return sprite
 
     def clear(self):
         """Kill all particles."""
         self.lifetime[:] = 0
+        self._alive[:] = False
+        self._free_stack[:] = np.arange(self.max_count, dtype=np.int32)
+        self._free_top = self.max_count
 
     @property
     def alive_count(self):
         """Number of currently alive particles (for debug display)."""
-        return int(np.sum(self.lifetime > 0))
+        return self.max_count - self._free_top
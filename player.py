@@ -29,62 +29,150 @@ class PlayerRenderer:
     neon silhouette effect.  Also handles invincibility flash animation.
     """
 
-    def __init__(self, width, height):
+    def __init__(self, width, height, body_res=None):
         self.width = width
         self.height = height
 
-        # Pre-build the dilation kernel so we don't recreate it per frame
-        k = cfg.BODY_DILATE_KERNEL
+        # The neon pipeline runs at body_res (default: BODY_RENDER_SCALE of
+        # the internal resolution) and the result is scaled up once.  Every
+        # OpenCV step below costs in proportion to the pixel count, and the
+        # glow hides the lower resolution.  Collision is unaffected.
+        if body_res is None:
+            body_res = (max(1, int(width * cfg.BODY_RENDER_SCALE)),
+                        max(1, int(height * cfg.BODY_RENDER_SCALE)))
+        self._body_w, self._body_h = body_res
+        self._scale = self._body_w / width
+
+        # Kernel sizes are in pixels, so they shrink with the resolution
+        self._blur_ksize = self._scaled_ksize(cfg.BODY_BLUR_KERNEL)
+        self._glow_ksize = self._scaled_ksize(cfg.BODY_GLOW_KERNEL)
+        self._simple_glow_ksize = self._scaled_ksize(15)
+
+        # Pre-build the dilation kernel so we don't recreate it per frame.
+        # Rounded up: rounding down turns the default 3x3 into a 1x1 at
+        # half resolution, which is a plain copy and leaves the outline thin
+        k = self._scaled_ksize(cfg.BODY_DILATE_KERNEL, round_up=True)
         self._dilate_kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (k, k))
 
-        # Neon color in BGR (for OpenCV operations) and RGB (for PyGame)
-        self._neon_bgr = np.array(cfg.COLOR_BODY_NEON[::-1], dtype=np.uint8)
-        self._neon_rgb = cfg.COLOR_BODY_NEON
+        # Neon color in RGB.  The pipeline works in RGB order directly:
+        # every OpenCV step is per-channel, so there is no BGR -> RGB
+        # conversion at the end.
+        self._neon_rgb = np.array(cfg.COLOR_BODY_NEON, dtype=np.uint8)
+
+        # Faint filled-silhouette tint (8% of the neon), added under the
+        # body mask as a scalar instead of blending a full-frame image
+        self._fill_tint = tuple(round(c * 0.08) for c in cfg.COLOR_BODY_NEON) + (0,)
+        self._neon_scalar = tuple(int(c) for c in cfg.COLOR_BODY_NEON) + (0,)
+
+        # Scratch buffers reused every frame via OpenCV's dst= arguments,
+        # so the pipeline doesn't allocate a dozen full-frame arrays per call
+        h, w = self._body_h, self._body_w
+        self._buf_mask = np.empty((h, w), dtype=np.uint8)
+        self._buf_blur = np.empty((h, w), dtype=np.uint8)
+        self._buf_edges = np.empty((h, w), dtype=np.uint8)
+        self._buf_thick = np.empty((h, w), dtype=np.uint8)
+        self._buf_colored = np.empty((h, w, 3), dtype=np.uint8)
+        self._buf_glow = np.empty((h, w, 3), dtype=np.uint8)
+        self._buf_comp = np.empty((h, w, 3), dtype=np.uint8)
+        self._buf_gray = np.empty((h, w), dtype=np.uint8)
+        self._buf_alpha = np.empty((h, w), dtype=np.uint8)
+
+        # Pipeline output surface, written in place through pygame.surfarray
+        # views.  It is in the display's native pixel format, so there is
+        # no RGBA pack, no tobytes() copy and blits take the fast path.
+        self._body_surface = pygame.Surface((w, h), pygame.SRCALPHA)
+
+        # Returned surface at internal resolution (the upscale target)
+        if (w, h) == (width, height):
+            self._out_surface = self._body_surface
+        else:
+            self._out_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        # Fully transparent result, returned when there is nothing to draw
+        self._empty_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        # Memoized output: the camera publishes masks at ~30Hz while the
+        # game renders at up to 60Hz, so consecutive frames often carry
+        # the same mask version and can reuse the last surface
+        self._last_version = -1
+        self._last_surface = None
+
+        # Dimmed copy for the idle screen, refreshed once per mask version
+        self._dim_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self._last_dim_version = -1
 
-    def render_body(self, body_mask, is_invincible=False, time_now=0.0):
+    def render_body(self, body_mask, is_invincible=False, time_now=0.0,
+                    version=None):
         """
         Given a binary body mask (uint8, 0 or 255), return a PyGame
         Surface (SRCALPHA) with the neon silhouette rendered on it.
 
         If is_invincible is True, the silhouette flashes on/off at
         INVINCIBILITY_FLASH_HZ frequency.
+
+        If version (from Camera.get_body_mask) matches the previous
+        call, the cached surface is returned without re-running the
+        pipeline.
+
+        The returned surface is reused by the next call; callers must
+        blit it before rendering again and must not modify it beyond
+        set_alpha(), which the next render resets.
         """
         # During invincibility, flash the body outline
         if is_invincible:
             flash = math.sin(time_now * cfg.INVINCIBILITY_FLASH_HZ * 2 * math.pi)
             if flash < 0:
                 # Return an empty surface (body is "invisible" this frame)
-                return pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+                return self._empty_surface
+
+        if version is not None and version == self._last_version:
+            return self._last_surface
+
+        # Nothing to outline: every step below would produce an entirely
+        # transparent image, so skip them
+        if not body_mask.any():
+            self._last_version = -1 if version is None else version
+            self._last_surface = self._empty_surface
+            return self._empty_surface
+
+        body_mask = self._fit_mask(body_mask)
 
         # ── Step 1: Smooth the mask ──
         # Gaussian blur reduces jagged edges from the segmentation output
         blurred_mask = cv2.GaussianBlur(
             body_mask,
-            (cfg.BODY_BLUR_KERNEL, cfg.BODY_BLUR_KERNEL),
+            (self._blur_ksize, self._blur_ksize),
             0,
+            dst=self._buf_blur,
         )
 
         # ── Step 2: Edge detection ──
-        edges = cv2.Canny(blurred_mask, cfg.BODY_CANNY_LOW, cfg.BODY_CANNY_HIGH)
+        edges = cv2.Canny(
+            blurred_mask, cfg.BODY_CANNY_LOW, cfg.BODY_CANNY_HIGH,
+            edges=self._buf_edges,
+        )
 
         # ── Step 3: Thicken the edges ──
         thick_edges = cv2.dilate(
             edges,
             self._dilate_kernel,
+            dst=self._buf_thick,
             iterations=cfg.BODY_DILATE_ITERATIONS,
         )
 
         # ── Step 4: Colorize the edges ──
-        # Create a 3-channel BGR image where edge pixels are the neon color
-        colored_edges = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        colored_edges[thick_edges > 0] = self._neon_bgr
+        # A 3-channel RGB image where edge pixels are the neon color
+        colored_edges = self._buf_colored
+        colored_edges.fill(0)
+        cv2.add(colored_edges, self._neon_scalar, dst=colored_edges, mask=thick_edges)
 
         # ── Step 5: Create the glow halo ──
         # Blur the colored edges to create a soft luminous spread
         glow = cv2.GaussianBlur(
             colored_edges,
-            (cfg.BODY_GLOW_KERNEL, cfg.BODY_GLOW_KERNEL),
+            (self._glow_ksize, self._glow_ksize),
             0,
+            dst=self._buf_glow,
         )
 
         # ── Step 6: Composite sharp edges on top of glow ──
@@ -93,32 +181,94 @@ class PlayerRenderer:
             glow, cfg.BODY_GLOW_INTENSITY,
             colored_edges, 1.0,
             0,
+            dst=self._buf_comp,
         )
 
         # Also add a faint filled silhouette for additional visual presence
-        # (very low opacity so the neon outline is still the star)
-        filled = np.zeros_like(composite)
-        filled[body_mask > 0] = self._neon_bgr
-        composite = cv2.addWeighted(composite, 1.0, filled, 0.08, 0)
+        # (very low opacity so the neon outline is still the star).
+        # A masked saturating add of the tint, done in place.
+        cv2.add(composite, self._fill_tint, dst=composite, mask=body_mask)
 
         # ── Convert to PyGame surface ──
-        # OpenCV is BGR, PyGame expects RGB
-        rgb = cv2.cvtColor(composite, cv2.COLOR_BGR2RGB)
+        surface = self._compose_rgba(composite)
 
-        # Create an alpha channel: pixels with any color get full alpha,
-        # pure black pixels get 0 alpha (transparent)
-        gray = cv2.cvtColor(composite, cv2.COLOR_BGR2GRAY)
-        alpha = np.where(gray > 5, 255, 0).astype(np.uint8)
+        # An unversioned render overwrites the shared surface, so it also
+        # invalidates the memoized one
+        self._last_version = -1 if version is None else version
+        self._last_surface = surface
+        return surface
 
-        # Stack into RGBA
-        rgba = np.dstack((rgb, alpha))
+    def render_body_dim(self, body_mask, time_now=0.0, alpha=80, version=None):
+        """
+        Same as render_body(), but returns a copy drawn at a constant
+        surface alpha (the dimmer silhouette shown on the idle screen).
+        The copy is memoized on version like render_body() itself, so an
+        unchanged mask costs nothing.
+        """
+        if (version is not None and version == self._last_dim_version
+                and alpha == self._dim_surface.get_alpha()):
+            return self._dim_surface
 
-        # Create PyGame surface from the numpy array
-        surface = pygame.image.frombuffer(
-            rgba.tobytes(), (self.width, self.height), "RGBA"
+        surface = self.render_body(body_mask, time_now=time_now, version=version)
+
+        # Raw 32-bit pixel copy: no blending, no new surface
+        dst = pygame.surfarray.pixels2d(self._dim_surface)
+        src = pygame.surfarray.pixels2d(surface)
+        dst[...] = src
+        del dst, src
+        self._dim_surface.set_alpha(alpha)
+
+        self._last_dim_version = -1 if version is None else version
+        return self._dim_surface
+
+    def _scaled_ksize(self, k, round_up=False):
+        """Odd kernel size equivalent to k at internal resolution."""
+        size = math.ceil(k * self._scale) if round_up else int(k * self._scale)
+        return max(1, size) | 1
+
+    def _fit_mask(self, mask):
+        """Bring a mask from internal resolution to the pipeline resolution."""
+        if mask.shape == self._buf_mask.shape:
+            return mask
+        return cv2.resize(
+            mask, (self._body_w, self._body_h),
+            dst=self._buf_mask,
+            interpolation=cv2.INTER_NEAREST,
         )
 
-        return surface
+    def _compose_rgba(self, rgb):
+        """
+        Write an RGB composite into the output surface, scaling it up to
+        internal resolution if the pipeline runs smaller.  Pixels with
+        any visible color get full alpha, near-black pixels get 0 alpha
+        (transparent).
+        """
+        gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY, dst=self._buf_gray)
+        _, alpha = cv2.threshold(
+            gray, 5, 255, cv2.THRESH_BINARY, dst=self._buf_alpha
+        )
+
+        surface = self._body_surface
+
+        # surfarray views are indexed [x, y]; transposing them gives
+        # [y, x] views that walk the surface memory in row order
+        rgb_view = pygame.surfarray.pixels3d(surface)
+        alpha_view = pygame.surfarray.pixels_alpha(surface)
+        rgb_view.transpose(1, 0, 2)[...] = rgb
+        alpha_view.T[...] = alpha
+        # Release the views so the surface is unlocked for blitting
+        del rgb_view, alpha_view
+
+        out = self._out_surface
+        if surface is not out:
+            if out.get_size() == (2 * self._body_w, 2 * self._body_h):
+                # Exact 2x: pygame's dedicated edge-preserving kernel
+                pygame.transform.scale2x(surface, out)
+            else:
+                pygame.transform.smoothscale(surface, out.get_size(), out)
+
+        out.set_alpha(255)  # undo any dimming applied by a caller
+        return out
 
     def render_body_simple(self, body_mask, is_invincible=False, time_now=0.0):
         """
@@ -129,21 +279,20 @@ class PlayerRenderer:
         if is_invincible:
             flash = math.sin(time_now * cfg.INVINCIBILITY_FLASH_HZ * 2 * math.pi)
             if flash < 0:
-                return pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+                return self._empty_surface
 
         # Simple: just colorize the mask directly with some blur for glow
-        colored = np.zeros((self.height, self.width, 3), dtype=np.uint8)
-        colored[body_mask > 0] = self._neon_bgr
-
-        glow = cv2.GaussianBlur(colored, (15, 15), 0)
-        composite = cv2.addWeighted(glow, 0.5, colored, 1.0, 0)
+        body_mask = self._fit_mask(body_mask)
+        colored = self._buf_colored
+        colored.fill(0)
+        cv2.add(colored, self._neon_scalar, dst=colored, mask=body_mask)
 
-        rgb = cv2.cvtColor(composite, cv2.COLOR_BGR2RGB)
-        gray = cv2.cvtColor(composite, cv2.COLOR_BGR2GRAY)
-        alpha = np.where(gray > 5, 255, 0).astype(np.uint8)
-        rgba = np.dstack((rgb, alpha))
-
-        surface = pygame.image.frombuffer(
-            rgba.tobytes(), (self.width, self.height), "RGBA"
+        k = self._simple_glow_ksize
+        glow = cv2.GaussianBlur(colored, (k, k), 0, dst=self._buf_glow)
+        composite = cv2.addWeighted(
+            glow, 0.5, colored, 1.0, 0, dst=self._buf_comp
         )
-        return surface
+
+        # Shares the output surface with render_body()
+        self._last_version = -1
+        return self._compose_rgba(composite)
@@ -10,6 +10,8 @@ public model storage into the 'assets/' directory.
 
 import os
 import ssl
+import time
+import http.client
 import urllib.request
 import sys
 
@@ -23,6 +25,14 @@ MODEL_URL = (
 MODEL_DIR = "assets"
 MODEL_FILENAME = "selfie_segmenter_landscape.tflite"
 
+# Stream the response in large reads through a large file buffer rather
+# than urlretrieve's 8 KB blocks
+CHUNK_SIZE = 1024 * 1024
+WRITE_BUFFER = 8 * 1024 * 1024
+
+# Attempts before giving up; waits 1, 2, 4, 8 s between them
+MAX_ATTEMPTS = 5
+
 
 def download_model():
     os.makedirs(MODEL_DIR, exist_ok=True)
@@ -37,29 +47,43 @@ def download_model():
     print(f"  URL: {MODEL_URL}")
     print(f"  Destination: {model_path}")
 
+    # Download next to the destination and rename on success, so an
+    # interrupted download never leaves a truncated model in place.
+    # A leftover .part file (from a failed attempt or an earlier run)
+    # is resumed rather than thrown away.
+    part_path = model_path + ".part"
+
     try:
-        # Try default SSL first, fall back to unverified context if certs
-        # are missing (common on fresh Windows Python installs).
-        try:
-            urllib.request.urlretrieve(MODEL_URL, model_path, _progress_hook)
-        except (ssl.SSLCertVerificationError, urllib.error.URLError):
-            print("\n  SSL certificate issue — retrying without verification...")
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            opener = urllib.request.build_opener(
-                urllib.request.HTTPSHandler(context=ctx)
-            )
-            urllib.request.install_opener(opener)
-            urllib.request.urlretrieve(MODEL_URL, model_path, _progress_hook)
+        ctx = None
+        failures = 0
+        while True:
+            try:
+                _fetch(MODEL_URL, part_path, context=ctx)
+                break
+            except (OSError, http.client.HTTPException) as e:
+                # Try default SSL first, fall back to unverified context if
+                # certs are missing (common on fresh Windows Python installs).
+                # The switch happens once and does not use up an attempt.
+                reason = getattr(e, "reason", e)
+                if ctx is None and isinstance(reason, ssl.SSLError):
+                    print("\n  SSL certificate issue — retrying without verification...")
+                    ctx = ssl.create_default_context()
+                    ctx.check_hostname = False
+                    ctx.verify_mode = ssl.CERT_NONE
+                    continue
+                failures += 1
+                if failures >= MAX_ATTEMPTS:
+                    raise
+                delay = 2 ** (failures - 1)
+                print(f"\n  {e} — retrying in {delay}s...")
+                time.sleep(delay)
 
+        os.replace(part_path, model_path)
         size = os.path.getsize(model_path)
         print(f"\n[OK] Download complete! ({size:,} bytes)")
         return model_path
     except Exception as e:
-        # Clean up partial download
-        if os.path.exists(model_path):
-            os.remove(model_path)
+        # The partial download is kept so the next run can resume it
         print(f"\n[ERROR] Download failed: {e}")
         print()
         print("Please download the model manually:")
@@ -69,8 +93,75 @@ def download_model():
         sys.exit(1)
 
 
-def _progress_hook(block_num, block_size, total_size):
-    downloaded = block_num * block_size
+def _fetch(url, dest, context=None):
+    """
+    Stream `url` into `dest` in CHUNK_SIZE reads, reporting progress.
+    If `dest` already holds part of the file, only the rest is requested
+    (HTTP Range) and appended; a server that ignores the Range header
+    sends the whole file, which then overwrites `dest`.
+    """
+    offset = os.path.getsize(dest) if os.path.exists(dest) else 0
+    request = urllib.request.Request(url)
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
+
+    try:
+        resp = urllib.request.urlopen(request, context=context)
+    except urllib.error.HTTPError as e:
+        if e.code == 416:
+            # The range no longer fits the file: start over next attempt
+            os.remove(dest)
+        raise
+
+    with resp:
+        if resp.status == 206:
+            total_size = _range_total(resp, offset, dest)
+        else:
+            offset = 0
+            length = resp.headers.get("Content-Length")
+            if length:
+                total_size = int(length)
+            elif resp.chunked:
+                # Chunked responses carry their own end marker, and
+                # http.client raises IncompleteRead if it is missing
+                total_size = 0
+            else:
+                raise IOError("server sent no length; the download cannot be verified")
+        downloaded = offset
+        mode = "ab" if offset else "wb"
+        with open(dest, mode, buffering=WRITE_BUFFER) as f:
+            while True:
+                chunk = resp.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+                downloaded += len(chunk)
+                _progress_hook(downloaded, total_size)
+
+    if total_size and downloaded != total_size:
+        raise IOError(f"incomplete download ({downloaded:,} of {total_size:,} bytes)")
+
+
+def _range_total(resp, offset, dest):
+    """
+    Full file size from a 206 response's Content-Range header
+    ("bytes START-END/TOTAL").  A range that doesn't start where `dest`
+    ends would corrupt it, so `dest` is discarded instead.
+    """
+    content_range = resp.headers.get("Content-Range", "")
+    try:
+        span, total = content_range.split(" ", 1)[1].split("/")
+        start = int(span.split("-")[0])
+        total = int(total)
+    except (IndexError, ValueError):
+        start, total = -1, 0
+    if start != offset or total <= 0:
+        os.remove(dest)
+        raise IOError(f"unexpected Content-Range '{content_range}'; restarting")
+    return total
+
+
+def _progress_hook(downloaded, total_size):
     if total_size > 0:
         percent = min(100, downloaded * 100 // total_size)
         bar = "#" * (percent // 2) + "-" * (50 - percent // 2)